@@ -3,28 +3,48 @@
 금칙어를 포함한 문장을 필터링합니다.
 """
 
-import json
+from functools import lru_cache
+import re
 from pathlib import Path
 
-_forbidden_words: set[str] | None = None
+import orjson
 
 
-def _load_forbidden_words() -> set[str]:
-    """금칙어 로드 (싱글톤).
+def _load_forbidden_words() -> frozenset[str]:
+    """금칙어 파일을 읽습니다.
+
+    컴파일된 패턴(_get_forbidden_pattern)만 캐시되므로 원본 단어 집합은
+    패턴 생성 후 메모리에 남지 않습니다.
 
     Returns:
         금칙어 집합
     """
-    global _forbidden_words
-    if _forbidden_words is None:
-        data_path = Path(__file__).parent.parent.parent / "data" / "forbidden_words.json"
-        if data_path.exists():
-            with open(data_path, encoding="utf-8") as f:
-                data = json.load(f)
-                _forbidden_words = set(data.get("forbidden", []))
-        else:
-            _forbidden_words = set()
-    return _forbidden_words
+    data_path = Path(__file__).parent.parent.parent / "data" / "forbidden_words.json"
+    if not data_path.exists():
+        return frozenset()
+    data = orjson.loads(data_path.read_bytes())
+    return frozenset(data.get("forbidden", []))
+
+
+@lru_cache(maxsize=1)
+def _get_forbidden_pattern() -> re.Pattern[str] | None:
+    """금칙어 전체를 하나의 정규식으로 컴파일 (최초 1회).
+
+    금칙어마다 부분 문자열 검사를 반복하지 않고, 긴 금칙어 우선의
+    alternation 하나로 문장을 한 번만 훑습니다. 금칙어도 소문자로 바꿔
+    소문자화한 문장과 비교하므로 대소문자를 구분하지 않습니다.
+
+    Returns:
+        컴파일된 패턴. 금칙어가 없으면 None.
+    """
+    words = sorted(
+        (word.lower() for word in _load_forbidden_words() if word),
+        key=len,
+        reverse=True,
+    )
+    if not words:
+        return None
+    return re.compile("|".join(map(re.escape, words)))
 
 
 def is_safe_sentence(sentence: str) -> bool:
@@ -42,14 +62,11 @@ def is_safe_sentence(sentence: str) -> bool:
         >>> is_safe_sentence("술을 마시고 싶어")
         False
     """
-    forbidden = _load_forbidden_words()
+    pattern = _get_forbidden_pattern()
+    if pattern is None:
+        return True
 
-    sentence_lower = sentence.lower()
-    for word in forbidden:
-        if word in sentence_lower:
-            return False
-
-    return True
+    return pattern.search(sentence.lower()) is None
 
 
 def filter_unsafe_sentences(sentences: list[str] | list[dict]) -> list:
@@ -66,6 +83,9 @@ def filter_unsafe_sentences(sentences: list[str] | list[dict]) -> list:
         >>> filter_unsafe_sentences(sentences)
         ['라면이 맛있어요']
     """
+    pattern = _get_forbidden_pattern()
+    search = pattern.search if pattern is not None else None
+
     safe_sentences = []
     for item in sentences:
         if isinstance(item, str):
@@ -77,7 +97,8 @@ def filter_unsafe_sentences(sentences: list[str] | list[dict]) -> list:
         else:
             continue
 
-        if is_safe_sentence(sentence):
+        # is_safe_sentence와 동일한 검사를 패턴 조회 없이 인라인으로 수행
+        if search is None or search(sentence.lower()) is None:
             safe_sentences.append(item)
 
     return safe_sentences
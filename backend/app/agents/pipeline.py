@@ -3,11 +3,16 @@
 Generate -> Validate -> Score -> Diversify 파이프라인을 실행합니다.
 """
 
+import asyncio
 import logging
+import re
 import time
 import uuid
 from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import chain
+from typing import Any, Callable
 
 from app.api.v2.schemas import (
     GenerateRequestV2,
@@ -17,18 +22,30 @@ from app.api.v2.schemas import (
 from app.agents.tools import (
     generate_candidates,
     validate_sentences,
-    get_passed_sentences,
-    score_sentences,
+    ValidationResult,
+    score_validation_results,
 )
+from app.agents.tools.score import _extract_sentence_structure, _extract_nouns
 # Guardrail 제거됨 - 치료사가 직접 검토
 from app.api.v2.schemas import Language
-from app.services.phoneme.korean import find_phoneme_matches
-from app.services.phoneme.english import find_phoneme_matches_en
+from app.services.phoneme.korean import find_phoneme_matches_cached
+from app.services.phoneme.english import find_phoneme_matches_en_cached
 
 logger = logging.getLogger(__name__)
 
+# 검증을 스레드 풀에 넘길 때의 묶음 크기
+_VALIDATION_CHUNK_SIZE = 16
 
-@dataclass
+# 생성 응답이 이보다 늦으면 남은 시도 중 하나를 미리 시작 (초)
+_HEDGE_DELAY_SECONDS = 20.0
+
+# 검증 실패 이유의 카테고리 키워드
+_FAIL_REASON_RE = re.compile(
+    r"word_count|phoneme|semantic_repetition|no_predicate|core_vocabulary"
+)
+
+
+@dataclass(slots=True)
 class PipelineMetrics:
     """파이프라인 품질 지표.
 
@@ -52,61 +69,88 @@ class PipelineMetrics:
     final_count: int = 0
 
 
+def _fail_category(fail_reason: str) -> str:
+    """검증 실패 이유 문자열에서 카테고리를 추출합니다.
+
+    Args:
+        fail_reason: ValidationResult.fail_reason
+
+    Returns:
+        카테고리 키 (word_count, phoneme, semantic_repetition,
+        no_predicate, core_vocabulary, other)
+    """
+    match = _FAIL_REASON_RE.search(fail_reason)
+    return match.group() if match else "other"
+
+
+def _classify_failures(results: list) -> Counter[str]:
+    """검증 결과 중 실패한 항목을 카테고리별로 집계합니다.
+
+    Args:
+        results: ValidationResult 리스트
+
+    Returns:
+        카테고리별 실패 횟수
+    """
+    return Counter(
+        _fail_category(r.fail_reason)
+        for r in results
+        if not r.passed and r.fail_reason
+    )
+
+
+@lru_cache(maxsize=4096)
+def _cached_sentence_structure(sentence: str, language: Language) -> str:
+    """문장 구조 추출 결과를 문장 단위로 캐시합니다."""
+    return _extract_sentence_structure(sentence, language)
+
+
+@lru_cache(maxsize=4096)
+def _cached_nouns(sentence: str, language: Language) -> frozenset[str]:
+    """명사 추출 결과를 문장 단위로 캐시합니다 (불변 집합으로 반환)."""
+    return frozenset(_extract_nouns(sentence, language))
+
+
 def _calculate_metrics(
-    all_candidates: list[dict],
-    validation_results: list,
+    generated_count: int,
+    validation_passed: int,
+    fail_counts: Counter[str],
     scored: list,
     language: Language,
 ) -> PipelineMetrics:
     """파이프라인 품질 지표를 계산합니다.
 
     Args:
-        all_candidates: 생성된 모든 후보
-        validation_results: Validation 결과
+        generated_count: 생성된 후보 수
+        validation_passed: Validation 통과 문장 수
+        fail_counts: 카테고리별 실패 횟수 (_classify_failures 누적값)
         scored: 최종 점수 매긴 문장들
         language: 언어
 
     Returns:
         PipelineMetrics
     """
-    from app.agents.tools.score import _extract_sentence_structure, _extract_nouns
-
     metrics = PipelineMetrics()
-    metrics.generated_count = len(all_candidates)
-    metrics.validation_passed = sum(1 for r in validation_results if r.passed)
+    metrics.generated_count = generated_count
+    metrics.validation_passed = validation_passed
     metrics.validation_rate = (
         (metrics.validation_passed / metrics.generated_count * 100)
         if metrics.generated_count > 0 else 0.0
     )
 
     # 실패 이유 집계
-    for r in validation_results:
-        if not r.passed and r.fail_reason:
-            # 실패 이유에서 카테고리 추출
-            if "word_count" in r.fail_reason:
-                key = "word_count"
-            elif "phoneme" in r.fail_reason:
-                key = "phoneme"
-            elif "semantic_repetition" in r.fail_reason:
-                key = "semantic_repetition"
-                metrics.semantic_duplicates += 1
-            elif "no_predicate" in r.fail_reason:
-                key = "no_predicate"
-            elif "core_vocabulary" in r.fail_reason:
-                key = "core_vocabulary"
-            else:
-                key = "other"
-            metrics.fail_reasons[key] = metrics.fail_reasons.get(key, 0) + 1
+    metrics.fail_reasons = dict(fail_counts)
+    metrics.semantic_duplicates = fail_counts["semantic_repetition"]
 
     # 구조 다양성 계산
     structures = set()
     all_nouns: list[str] = []
 
     for item in scored:
-        structure = _extract_sentence_structure(item.sentence, language)
+        structure = _cached_sentence_structure(item.sentence, language)
         structures.add(structure)
 
-        nouns = _extract_nouns(item.sentence, language)
+        nouns = _cached_nouns(item.sentence, language)
         all_nouns.extend(nouns)
 
     metrics.unique_structures = len(structures)
@@ -137,7 +181,7 @@ def _log_metrics(metrics: PipelineMetrics) -> None:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """파이프라인 결과.
 
@@ -180,9 +224,10 @@ async def run_pipeline(
         True
     """
     start_time = time.time()
-    all_candidates: list[dict] = []  # 지표용: 생성된 모든 후보
-    all_validation_results: list = []  # 지표용: 모든 validation 결과
-    all_validated: list[dict] = []
+    generated_count = 0  # 지표용: 생성된 후보 수
+    all_fail_counts: Counter[str] = Counter()  # 지표용: 실패 이유별 카운트
+    attempt_results: list[list[ValidationResult]] = []  # 배치별 통과 문장 (마지막에 한 번만 합침)
+    validated_count = 0
     all_contrast_sets: list[dict] = []
 
     # target이 없을 수 있음 (core_vocabulary)
@@ -194,88 +239,112 @@ async def run_pipeline(
     # 유저 선택용으로 더 많은 후보 생성 (요청의 3배)
     target_candidates = request.count * 3
 
-    # 재시도 루프
-    for attempt in range(max_attempts):
-        # 1. Generate
-        batch_size = target_candidates - len(all_validated)
-        if batch_size <= 0:
-            logger.info(f"[Pipeline] 시도 {attempt+1}: 충분한 후보 확보, 생성 스킵")
-            break
-
-        # LLM 통과율 고려하여 더 많이 요청
-        batch_size = int(batch_size * 1.5)
-        logger.info(f"[Pipeline] 시도 {attempt+1}/{max_attempts}: batch_size={batch_size}")
-
-        gen_start = time.time()
-        try:
-            gen_result = await generate_candidates(request, batch_size)
-            candidates, contrast_sets = _normalize_generation_result(gen_result)
-            gen_time = int((time.time() - gen_start) * 1000)
-            logger.info(f"[Generate] 완료 - {len(candidates)}개 생성, contrast_sets={len(contrast_sets)}개, {gen_time}ms")
-        except Exception as e:
-            gen_time = int((time.time() - gen_start) * 1000)
-            logger.error(f"[Generate] 실패 - {gen_time}ms, error: {e}")
-            continue
-
-        # 2. Validate (Guardrail 제거 - 치료사가 직접 검토)
-        val_start = time.time()
-        results = validate_sentences(candidates, request)
-        passed = get_passed_sentences(results)
-        val_time = int((time.time() - val_start) * 1000)
-
-        # 지표용 데이터 수집
-        all_candidates.extend(candidates)
-        all_validation_results.extend(results)
-
-        failed_count = len(candidates) - len(passed)
-        if failed_count > 0:
-            # 실패 이유 로깅
-            fail_reasons = {}
-            for r in results:
-                if not r.passed and r.fail_reason:
-                    # 실패 이유에서 핵심 키워드 추출
-                    if "word_count" in r.fail_reason:
-                        key = "word_count"
-                    elif "phoneme" in r.fail_reason:
-                        key = "no_phoneme"
-                    elif "semantic_repetition" in r.fail_reason:
-                        key = "semantic_rep"
-                    elif "no_predicate" in r.fail_reason:
-                        key = "no_predicate"
-                    else:
-                        key = "other"
-                    fail_reasons[key] = fail_reasons.get(key, 0) + 1
-            logger.warning(
-                f"[Validate] {len(passed)}/{len(candidates)} 통과, "
-                f"실패: {fail_reasons}, {val_time}ms"
+    # 첫 배치만 먼저 요청하고, 다음 배치는 검증 후 부족분만큼만 요청.
+    # 응답이 _HEDGE_DELAY_SECONDS 넘게 늦어지면 다음 배치를 미리 시작(hedge)
+    gen_start = time.time()
+    pending: set[asyncio.Task] = set()
+    started = 0
+    finished = 0
+
+    def start_next_attempt() -> None:
+        nonlocal started
+        # LLM 통과율 고려하여 부족분보다 더 많이 요청
+        batch_size = int((target_candidates - validated_count) * 1.5)
+        started += 1
+        logger.info(f"[Pipeline] 시도 {started}/{max_attempts}: batch_size={batch_size}")
+        # 캐시는 첫 시도에만 사용 (재시도가 같은 결과를 다시 받지 않도록)
+        pending.add(asyncio.create_task(
+            generate_candidates(request, batch_size, use_cache=started == 1)
+        ))
+
+    start_next_attempt()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(
+                pending,
+                timeout=_HEDGE_DELAY_SECONDS if started < max_attempts else None,
+                return_when=asyncio.FIRST_COMPLETED,
             )
-        else:
-            logger.info(f"[Validate] {len(passed)}/{len(candidates)} 통과, {val_time}ms")
-
-        all_validated.extend(passed)
-        if contrast_sets:
-            logger.debug(f"[ContrastSet] contrast_sets={len(contrast_sets)}")
-            validated_sets = _validate_contrast_sets(contrast_sets, request)
-            logger.debug(f"[ContrastSet] validated_sets={len(validated_sets)}")
-            all_contrast_sets.extend(validated_sets)
-            if len(all_contrast_sets) > request.count:
-                del all_contrast_sets[request.count:]
-        logger.info(f"[Pipeline] 시도 {attempt+1} 완료: 누적 {len(all_validated)}개")
-
-        # 충분한 후보 확보 시 종료
-        if len(all_validated) >= target_candidates:
-            break
+            if not done:
+                logger.info(f"[Pipeline] 응답 지연 {_HEDGE_DELAY_SECONDS}s 초과, 다음 배치 시작")
+                start_next_attempt()
+                continue
+
+            for task in done:
+                pending.discard(task)
+                finished += 1
+
+                # 1. Generate
+                try:
+                    gen_result = task.result()
+                    candidates, contrast_sets = _normalize_generation_result(gen_result)
+                    gen_time = int((time.time() - gen_start) * 1000)
+                    logger.info(f"[Generate] 완료 - {len(candidates)}개 생성, contrast_sets={len(contrast_sets)}개, {gen_time}ms")
+                except Exception as e:
+                    gen_time = int((time.time() - gen_start) * 1000)
+                    logger.error(f"[Generate] 실패 - {gen_time}ms, error: {e}")
+                    continue
+
+                # 2. Validate (Guardrail 제거 - 치료사가 직접 검토)
+                val_start = time.time()
+                results = await _validate_in_chunks(candidates, request)
+                passed = [r for r in results if r.passed]
+                val_time = int((time.time() - val_start) * 1000)
+
+                # 지표용 데이터 수집 (실패 이유는 배치당 한 번만 분류)
+                fail_counts = _classify_failures(results)
+                generated_count += len(candidates)
+                all_fail_counts.update(fail_counts)
+
+                failed_count = len(candidates) - len(passed)
+                if failed_count > 0:
+                    # 실패 이유 로깅
+                    logger.warning(
+                        f"[Validate] {len(passed)}/{len(candidates)} 통과, "
+                        f"실패: {dict(fail_counts)}, {val_time}ms"
+                    )
+                else:
+                    logger.info(f"[Validate] {len(passed)}/{len(candidates)} 통과, {val_time}ms")
+
+                attempt_results.append(passed)
+                validated_count += len(passed)
+                if contrast_sets:
+                    logger.debug(f"[ContrastSet] contrast_sets={len(contrast_sets)}")
+                    validated_sets = _validate_contrast_sets(contrast_sets, request)
+                    logger.debug(f"[ContrastSet] validated_sets={len(validated_sets)}")
+                    all_contrast_sets.extend(validated_sets)
+                    if len(all_contrast_sets) > request.count:
+                        del all_contrast_sets[request.count:]
+                logger.info(f"[Pipeline] 배치 {finished}/{started} 완료: 누적 {validated_count}개")
+
+            # 충분한 후보 확보 시 종료
+            if validated_count >= target_candidates:
+                logger.info("[Pipeline] 충분한 후보 확보, 남은 배치 취소")
+                break
+            # 진행 중인 배치가 없고 시도가 남았으면 부족분만큼 재요청
+            if not pending and started < max_attempts:
+                start_next_attempt()
+    finally:
+        for task in pending:
+            task.cancel()
+        # 취소/실패한 태스크의 예외를 회수해 미처리 경고를 막음
+        await asyncio.gather(*pending, return_exceptions=True)
 
     # 3. Score (Diversify 제거 - 유저가 직접 선택)
     score_start = time.time()
-    scored = score_sentences(all_validated, request)
+    all_validated = list(chain.from_iterable(attempt_results))
+    # 점수 계산은 순수 파이썬 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드 풀에서 실행
+    scored = await asyncio.get_running_loop().run_in_executor(
+        None, score_validation_results, all_validated, request
+    )
     score_time = int((time.time() - score_start) * 1000)
     logger.info(f"[Score] {len(scored)}개 점수 계산, {score_time}ms")
 
     # 4. 지표 계산 및 로깅
     metrics = _calculate_metrics(
-        all_candidates,
-        all_validation_results,
+        generated_count,
+        validated_count,
+        all_fail_counts,
         scored,
         request.language,
     )
@@ -310,6 +379,33 @@ async def run_pipeline(
     )
 
 
+async def _validate_in_chunks(
+    candidates: list[dict] | list[str],
+    request: GenerateRequestV2,
+) -> list:
+    """후보를 작은 묶음으로 나눠 스레드 풀에서 검증합니다.
+
+    동기 검증이 이벤트 루프를 막지 않으므로, 한 배치를 검증하는 동안에도
+    다른 배치의 LLM 응답 수신이 계속 진행됩니다.
+
+    Args:
+        candidates: 생성된 후보들
+        request: 생성 요청
+
+    Returns:
+        입력 순서를 유지한 ValidationResult 리스트
+    """
+    loop = asyncio.get_running_loop()
+    chunks = [
+        candidates[i:i + _VALIDATION_CHUNK_SIZE]
+        for i in range(0, len(candidates), _VALIDATION_CHUNK_SIZE)
+    ]
+    chunk_results = await asyncio.gather(
+        *(loop.run_in_executor(None, validate_sentences, chunk, request) for chunk in chunks)
+    )
+    return [result for chunk in chunk_results for result in chunk]
+
+
 def _to_therapy_item(scored, request: GenerateRequestV2) -> TherapyItemV2:
     """ScoredSentence를 TherapyItemV2로 변환.
 
@@ -321,20 +417,18 @@ def _to_therapy_item(scored, request: GenerateRequestV2) -> TherapyItemV2:
         TherapyItemV2
     """
     # 매칭 단어 위치 계산 (target이 있을 때만)
+    # 위치는 점수 계산 단계에서 이미 구해 둠
     matched_words = []
     if request.target:
-        text = scored.sentence
-        for word in scored.matched_words:
-            start = text.find(word)
-            if start >= 0:
-                matched_words.append(
-                    MatchedWord(
-                        word=word,
-                        startIndex=start,
-                        endIndex=start + len(word),
-                        positions=[request.target.position],
-                    )
-                )
+        matched_words = [
+            MatchedWord(
+                word=word,
+                startIndex=start,
+                endIndex=end,
+                positions=[request.target.position],
+            )
+            for word, start, end in scored.matched_word_positions
+        ]
 
     return TherapyItemV2(
         id=str(uuid.uuid4()),
@@ -360,6 +454,33 @@ def _normalize_generation_result(result) -> tuple[list[dict] | list[str], list[d
     return candidates, contrast_sets or []
 
 
+def _phoneme_matcher(request: GenerateRequestV2) -> Callable[[str], Any] | None:
+    """요청의 언어/타깃에 맞는 음소 매칭 함수를 만듭니다.
+
+    Args:
+        request: 생성 요청
+
+    Returns:
+        문장을 받아 매칭 결과를 반환하는 함수. 음소 타깃이 없으면 None.
+    """
+    target = request.target
+    if not (target and target.phoneme):
+        return None
+
+    if request.language == Language.KO:
+        return partial(
+            find_phoneme_matches_cached,
+            phoneme=target.phoneme,
+            position=target.position.value,
+            min_occurrences=target.minOccurrences,
+        )
+    return partial(
+        find_phoneme_matches_en_cached,
+        target=target.phoneme,
+        min_occurrences=target.minOccurrences,
+    )
+
+
 def _validate_contrast_sets(
     contrast_sets: list[dict],
     request: GenerateRequestV2,
@@ -371,6 +492,10 @@ def _validate_contrast_sets(
     - Target/contrast words must appear in their respective token lists.
     """
     validated: list[dict] = []
+    # 언어/타깃 분기는 세트마다 반복하지 않고 한 번만 결정
+    match_phoneme = _phoneme_matcher(request)
+    min_occurrences = request.target.minOccurrences if request.target else 0
+
     for i, contrast_set in enumerate(contrast_sets):
         target_sentence = contrast_set.get("targetSentence", {})
         contrast_sentence = contrast_set.get("contrastSentence", {})
@@ -395,24 +520,12 @@ def _validate_contrast_sets(
             continue
 
         # Validate target sentence has required phoneme
-        if request.target and request.target.phoneme:
-            if request.language == Language.KO:
-                match_result = find_phoneme_matches(
-                    target_text,
-                    request.target.phoneme,
-                    request.target.position.value,
-                    request.target.minOccurrences,
-                )
-            else:
-                match_result = find_phoneme_matches_en(
-                    target_text,
-                    request.target.phoneme,
-                    request.target.minOccurrences,
-                )
+        if match_phoneme is not None:
+            match_result = match_phoneme(target_text)
             if not match_result.meets_minimum:
                 logger.debug(
                     f"[ContrastSet #{i}] 실패: 음소 불충분 - "
-                    f"text='{target_text}', found={match_result.count}, need={request.target.minOccurrences}"
+                    f"text='{target_text}', found={match_result.count}, need={min_occurrences}"
                 )
                 continue
 
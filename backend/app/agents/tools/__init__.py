@@ -9,7 +9,7 @@
 
 from .generate import generate_candidates
 from .validate import validate_sentences, ValidationResult, get_passed_sentences
-from .score import score_sentences, ScoredSentence
+from .score import score_sentences, score_validation_results, ScoredSentence
 from .diversify import diversify_results
 
 __all__ = [
@@ -18,6 +18,7 @@ __all__ = [
     "ValidationResult",
     "get_passed_sentences",
     "score_sentences",
+    "score_validation_results",
     "ScoredSentence",
     "diversify_results",
 ]
@@ -3,16 +3,23 @@
 유사한 문장이 너무 많이 선택되지 않도록 결과의 다양성을 보장합니다.
 """
 
-from collections import defaultdict
+from functools import lru_cache
+import heapq
+from itertools import islice
 import re
 
 from app.agents.tools.score import ScoredSentence
 
+# 패턴 비교에 쓰지 않는 문자 (숫자/영문/한글 외)
+_NONWORD_RE = re.compile(r"[^0-9A-Za-z가-힣]")
+
 
 def diversify_results(
     scored: list[ScoredSentence],
     count: int,
     max_similar: int = 2,
+    *,
+    quota_only: bool = False,
 ) -> list[ScoredSentence]:
     """다양성을 보장하며 최종 결과를 선택합니다.
 
@@ -23,6 +30,8 @@ def diversify_results(
         scored: 점수순 정렬된 문장들
         count: 선택할 개수
         max_similar: 유사 문장 최대 개수 (기본: 2)
+        quota_only: True면 시작어/종결형 페널티 없이 패턴·난이도 한도만 보고
+            한 번 훑어 선택 (O(N), 정확한 페널티 기반 선택이 필요 없을 때)
 
     Returns:
         다양성이 보장된 ScoredSentence 리스트
@@ -41,83 +50,223 @@ def diversify_results(
     if len(scored) <= count:
         return scored
 
-    selected: list[ScoredSentence] = []
-    selected_indexes: set[int] = set()
-    pattern_counts: dict[str, int] = defaultdict(int)
-    start_counts: dict[str, int] = defaultdict(int)
-    ending_counts: dict[str, int] = defaultdict(int)
-    difficulty_counts: dict[str, int] = defaultdict(int)
+    # 후보별 다양성 키/점수를 속성별 병렬 리스트로 사전 계산
+    # 키 문자열은 등장 순서대로 작은 정수 ID로 바꿔 카운트를 리스트 인덱스로 조회
+    interns: tuple[dict[str, int], ...] = ({}, {}, {}, {})
+    scores = [sentence.score for sentence in scored]
+    pattern_keys, start_keys, ending_keys, difficulty_keys = (
+        list(column)
+        for column in zip(*(_extract_keys(sentence, interns) for sentence in scored))
+    )
 
     # 난이도별 목표 개수 계산 (균등 분배)
     target_per_difficulty = count // 3 if count >= 3 else 1
 
-    # 후보별 다양성 키 사전 계산
-    candidate_keys = []
-    for sentence in scored:
-        candidate_keys.append(
-            {
-                "pattern": _get_pattern(sentence),
-                "start": _get_start_key(sentence),
-                "ending": _get_ending_key(sentence),
-                "difficulty": sentence.difficulty or "unknown",
-            }
+    if quota_only:
+        picked = _quota_select(
+            pattern_keys,
+            difficulty_keys,
+            max_similar,
+            target_per_difficulty,
+            count,
+        )
+    else:
+        picked = _greedy_select(
+            scores,
+            pattern_keys,
+            start_keys,
+            ending_keys,
+            difficulty_keys,
+            max_similar,
+            target_per_difficulty,
+            count,
         )
+    selected = [scored[idx] for idx in picked]
 
-    # 다양성 페널티를 반영한 그리디 선택
-    for _ in range(count):
-        best_idx = None
-        best_adjusted_score = None
+    # 부족하면 남은 것 중 추가 (선택되지 않은 후보만 순서대로 필요한 만큼)
+    if len(selected) < count:
+        picked_mask = bytearray(len(scored))
+        for idx in picked:
+            picked_mask[idx] = 1
+        unpicked = (
+            sentence for idx, sentence in enumerate(scored) if not picked_mask[idx]
+        )
+        selected.extend(islice(unpicked, count - len(selected)))
 
-        for idx, sentence in enumerate(scored):
-            if idx in selected_indexes:
-                continue
+    return selected
 
-            keys = candidate_keys[idx]
-            if pattern_counts[keys["pattern"]] >= max_similar:
-                continue
 
-            # 반복되는 시작어/종결형에 페널티 부여
-            penalty = (
-                start_counts[keys["start"]] * 3
-                + ending_counts[keys["ending"]] * 4
-            )
+def _extract_keys(
+    sentence: ScoredSentence,
+    interns: tuple[dict[str, int], ...],
+) -> tuple[int, int, int, int]:
+    """문장의 패턴/시작/종결/난이도 키를 한 번에 추출해 정수 ID로 반환합니다.
 
-            # 난이도 균형 페널티: 목표를 초과하면 큰 페널티
-            diff_count = difficulty_counts[keys["difficulty"]]
-            if diff_count >= target_per_difficulty:
-                penalty += (diff_count - target_per_difficulty + 1) * 10
+    Args:
+        sentence: 점수가 부여된 문장
+        interns: 키 종류별 (키 문자열 -> ID) 사전 4개. 처음 보는 키는 추가됨
 
-            adjusted_score = sentence.score - penalty
+    Returns:
+        (패턴 ID, 시작 ID, 종결 ID, 난이도 ID)
+    """
+    pattern_ids, start_ids, ending_ids, difficulty_ids = interns
+    # 세 키 추출이 같은 토큰 리스트를 공유하도록 한 번만 분리
+    words = sentence.sentence.split()
+    pattern_key = _get_pattern(sentence, words)
+    start_key = _get_start_key(words)
+    ending_key = _get_ending_key(words)
+    difficulty_key = sentence.difficulty or "unknown"
+    return (
+        pattern_ids.setdefault(pattern_key, len(pattern_ids)),
+        start_ids.setdefault(start_key, len(start_ids)),
+        ending_ids.setdefault(ending_key, len(ending_ids)),
+        difficulty_ids.setdefault(difficulty_key, len(difficulty_ids)),
+    )
+
+
+def _greedy_select(
+    scores: list[float],
+    pattern_keys: list[int],
+    start_keys: list[int],
+    ending_keys: list[int],
+    difficulty_keys: list[int],
+    max_similar: int,
+    target_per_difficulty: int,
+    count: int,
+) -> list[int]:
+    """다양성 페널티를 반영해 선택할 후보 인덱스를 고릅니다.
 
-            if best_idx is None or adjusted_score > best_adjusted_score:
-                best_idx = idx
-                best_adjusted_score = adjusted_score
+    ScoredSentence 대신 속성별 병렬 리스트만 받으므로 객체 접근 없이 동작합니다.
+    각 키는 0부터 시작하는 연속 정수 ID입니다.
 
-        if best_idx is None:
-            break
+    Args:
+        scores: 후보별 기본 점수
+        pattern_keys: 후보별 패턴 키 ID
+        start_keys: 후보별 시작 키 ID
+        ending_keys: 후보별 종결 키 ID
+        difficulty_keys: 후보별 난이도 키 ID
+        max_similar: 동일 패턴 최대 개수
+        target_per_difficulty: 난이도별 목표 개수
+        count: 선택할 개수
 
-        selected_indexes.add(best_idx)
-        selected.append(scored[best_idx])
+    Returns:
+        선택 순서대로 정렬된 후보 인덱스 리스트 (count개보다 적을 수 있음)
+    """
+    picked: list[int] = []
+    pattern_counts = [0] * (max(pattern_keys, default=-1) + 1)
+    start_counts = [0] * (max(start_keys, default=-1) + 1)
+    ending_counts = [0] * (max(ending_keys, default=-1) + 1)
+    difficulty_counts = [0] * (max(difficulty_keys, default=-1) + 1)
+
+    def adjusted_score(idx: int) -> float:
+        # 반복되는 시작어/종결형에 페널티 부여
+        penalty = (
+            start_counts[start_keys[idx]] * 3
+            + ending_counts[ending_keys[idx]] * 4
+        )
 
-        keys = candidate_keys[best_idx]
-        pattern_counts[keys["pattern"]] += 1
-        start_counts[keys["start"]] += 1
-        ending_counts[keys["ending"]] += 1
-        difficulty_counts[keys["difficulty"]] += 1
+        # 난이도 균형 페널티: 목표를 초과하면 큰 페널티
+        diff_count = difficulty_counts[difficulty_keys[idx]]
+        if diff_count >= target_per_difficulty:
+            penalty += (diff_count - target_per_difficulty + 1) * 10
+
+        return scores[idx] - penalty
+
+    # 다양성 페널티를 반영한 그리디 선택 (lazy greedy)
+    # 카운트는 늘어나기만 하므로 힙에 저장된 점수는 항상 실제 점수의 상한입니다.
+    # 꺼낸 후보의 점수를 다시 계산해 그대로면 선택하고, 낮아졌으면 다시 넣습니다.
+    # 동점은 인덱스가 작은 후보가 먼저 나오므로 전체 스캔 방식과 결과가 같습니다.
+    heap = [(-score, idx) for idx, score in enumerate(scores)]
+    heapq.heapify(heap)
+
+    # 아직 선택 가능한(패턴 한도 미달) 후보 수. 0이 되면 힙을 비울 필요 없이 종료
+    pattern_remaining = [0] * len(pattern_counts)
+    for pattern_key in pattern_keys:
+        pattern_remaining[pattern_key] += 1
+    selectable = len(scores) if max_similar > 0 else 0
+
+    while selectable and len(picked) < count:
+        neg_score, idx = heapq.heappop(heap)
+
+        if pattern_counts[pattern_keys[idx]] >= max_similar:
+            # 패턴 카운트는 줄지 않으므로 이 후보는 다시 볼 필요 없음
+            continue
+
+        current = adjusted_score(idx)
+        if current != -neg_score:
+            heapq.heappush(heap, (-current, idx))
+            continue
+
+        picked.append(idx)
+        selectable -= 1
+        pattern_key = pattern_keys[idx]
+        pattern_remaining[pattern_key] -= 1
+        pattern_counts[pattern_key] += 1
+        if pattern_counts[pattern_key] == max_similar:
+            # 패턴이 한도에 도달: 같은 패턴의 남은 후보는 모두 선택 불가
+            selectable -= pattern_remaining[pattern_key]
+        start_counts[start_keys[idx]] += 1
+        ending_counts[ending_keys[idx]] += 1
+        difficulty_counts[difficulty_keys[idx]] += 1
+
+    return picked
+
+
+def _quota_select(
+    pattern_keys: list[int],
+    difficulty_keys: list[int],
+    max_similar: int,
+    target_per_difficulty: int,
+    count: int,
+) -> list[int]:
+    """점수순 후보를 한 번 훑으며 패턴/난이도 한도 안에서 선택합니다.
 
-    # 부족하면 남은 것 중 추가
-    if len(selected) < count:
-        for idx, sentence in enumerate(scored):
-            if idx in selected_indexes:
-                continue
-            selected.append(sentence)
-            if len(selected) >= count:
-                break
+    난이도 한도만 넘은 후보는 보류했다가 패턴 한도 안에서 다시 채우고,
+    그래도 부족하면 호출 측의 보충 단계에서 채웁니다.
 
-    return selected
+    Args:
+        pattern_keys: 후보별 패턴 키 ID
+        difficulty_keys: 후보별 난이도 키 ID
+        max_similar: 동일 패턴 최대 개수
+        target_per_difficulty: 난이도별 최대 개수
+        count: 선택할 개수
 
+    Returns:
+        선택 순서대로 정렬된 후보 인덱스 리스트 (count개보다 적을 수 있음)
+    """
+    picked: list[int] = []
+    deferred: list[int] = []  # 난이도 한도만 넘은 후보 (패턴은 여유)
+    pattern_counts = [0] * (max(pattern_keys, default=-1) + 1)
+    difficulty_counts = [0] * (max(difficulty_keys, default=-1) + 1)
+
+    for idx, (pattern_key, difficulty_key) in enumerate(
+        zip(pattern_keys, difficulty_keys)
+    ):
+        if pattern_counts[pattern_key] >= max_similar:
+            continue
+        if difficulty_counts[difficulty_key] >= target_per_difficulty:
+            deferred.append(idx)
+            continue
+        picked.append(idx)
+        if len(picked) >= count:
+            return picked
+        pattern_counts[pattern_key] += 1
+        difficulty_counts[difficulty_key] += 1
+
+    # 난이도 균형보다 패턴 다양성을 우선해 보류한 후보로 채움
+    for idx in deferred:
+        pattern_key = pattern_keys[idx]
+        if pattern_counts[pattern_key] >= max_similar:
+            continue
+        picked.append(idx)
+        if len(picked) >= count:
+            break
+        pattern_counts[pattern_key] += 1
+
+    return picked
 
-def _get_pattern(sentence: ScoredSentence) -> str:
+
+def _get_pattern(sentence: ScoredSentence, words: list[str]) -> str:
     """문장의 패턴 키 추출.
 
     첫 번째 매칭 단어의 앞 2글자를 패턴으로 사용합니다.
@@ -125,6 +274,7 @@ def _get_pattern(sentence: ScoredSentence) -> str:
 
     Args:
         sentence: 점수가 부여된 문장
+        words: 문장을 공백으로 분리한 토큰 리스트
 
     Returns:
         패턴 키 문자열
@@ -135,58 +285,65 @@ def _get_pattern(sentence: ScoredSentence) -> str:
         return _normalize_token(first_match)
 
     # 매칭 단어 없으면 문장 첫 단어
-    words = sentence.sentence.split()
-    if words:
-        return _normalize_token(words[0])
-
-    return ""
+    return _get_start_key(words)
 
 
-def _get_start_key(sentence: ScoredSentence) -> str:
+def _get_start_key(words: list[str]) -> str:
     """문장 시작 패턴 키 추출.
 
     Args:
-        sentence: 점수가 부여된 문장
+        words: 문장을 공백으로 분리한 토큰 리스트
 
     Returns:
         시작 패턴 키 문자열
     """
-    words = sentence.sentence.split()
     if not words:
         return ""
     return _normalize_token(words[0])
 
 
-def _get_ending_key(sentence: ScoredSentence) -> str:
+def _get_ending_key(words: list[str]) -> str:
     """문장 종결 패턴 키 추출.
 
     Args:
-        sentence: 점수가 부여된 문장
+        words: 문장을 공백으로 분리한 토큰 리스트
 
     Returns:
         종결 패턴 키 문자열
     """
-    text = sentence.sentence.strip()
-    if not text:
+    if not words:
         return ""
 
-    if text.endswith("?"):
+    last_word = words[-1]
+    if last_word.endswith("?"):
         return "?"
-    if text.endswith("!"):
+    if last_word.endswith("!"):
         return "!"
 
-    text = text.rstrip(".")
-    words = text.split()
-    last_word = words[-1] if words else text
+    # 문장 끝 마침표 제거. 마침표만 있는 토큰이면 그 앞 단어를 그대로 사용
+    last_word = last_word.rstrip(".")
+    if not last_word and len(words) > 1:
+        last_word = words[-2]
+    return _ending_key_from_word(last_word)
 
-    for ending in _COMMON_ENDINGS:
-        if last_word.endswith(ending):
-            return ending
 
-    normalized = re.sub(r"[^0-9A-Za-z가-힣]", "", last_word)
-    if not normalized:
-        return ""
-    return normalized[-2:] if len(normalized) >= 2 else normalized
+@lru_cache(maxsize=4096)
+def _ending_key_from_word(last_word: str) -> str:
+    """마지막 단어에서 종결 패턴 키 추출 (캐시됨).
+
+    Args:
+        last_word: 문장 끝 마침표를 제거한 마지막 단어
+
+    Returns:
+        종결 패턴 키 문자열
+    """
+    match = _ENDING_RE.search(last_word)
+    if match:
+        return match.group(1)
+
+    normalized = _NONWORD_RE.sub("", last_word)
+    # 슬라이싱은 길이가 짧아도 안전하므로 분기 없이 마지막 2글자
+    return normalized[-2:]
 
 
 _COMMON_ENDINGS = [
@@ -206,7 +363,15 @@ _COMMON_ENDINGS = [
     "다",
 ]
 
+# 가장 먼저 시작하는(=가장 긴) 어미가 매칭되도록 긴 것부터 정렬
+_ENDING_RE = re.compile(
+    "("
+    + "|".join(map(re.escape, sorted(_COMMON_ENDINGS, key=len, reverse=True)))
+    + ")$"
+)
+
 
+@lru_cache(maxsize=4096)
 def _normalize_token(token: str) -> str:
     """패턴 비교용 토큰 정규화.
 
@@ -216,19 +381,16 @@ def _normalize_token(token: str) -> str:
     Returns:
         정규화된 토큰
     """
-    cleaned = re.sub(r"[^0-9A-Za-z가-힣]", "", token)
+    cleaned = _NONWORD_RE.sub("", token)
     if not cleaned:
         return ""
 
-    if _contains_korean(cleaned):
+    # 정리 후에는 [0-9A-Za-z가-힣]만 남으므로 비ASCII 문자 = 한글
+    if not cleaned.isascii():
         return _strip_korean_particles(cleaned)
     return cleaned.lower()
 
 
-def _contains_korean(text: str) -> bool:
-    return bool(re.search(r"[가-힣]", text))
-
-
 _KOREAN_PARTICLES = [
     "이랑",
     "랑",
@@ -257,9 +419,16 @@ _KOREAN_PARTICLES = [
     "만",
 ]
 
+# 앞에 최소 한 글자가 남는 가장 긴 조사를 한 번에 찾음
+_PARTICLE_RE = re.compile(
+    "(?<=.)(?:"
+    + "|".join(map(re.escape, sorted(_KOREAN_PARTICLES, key=len, reverse=True)))
+    + ")$"
+)
+
 
 def _strip_korean_particles(word: str) -> str:
-    for particle in _KOREAN_PARTICLES:
-        if word.endswith(particle) and len(word) > len(particle):
-            return word[: -len(particle)]
+    match = _PARTICLE_RE.search(word)
+    if match:
+        return word[: match.start()]
     return word
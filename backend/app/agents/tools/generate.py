@@ -11,13 +11,20 @@ Example:
     True
 """
 
+import asyncio
+from collections import OrderedDict
+import copy
 from dataclasses import dataclass
-import json
+from functools import partial
+import hashlib
 import logging
 import re
 import time
+import weakref
 
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+import orjson
 
 from app.config import settings
 from app.api.v2.schemas import DifficultyLevel, GenerateRequestV2
@@ -29,9 +36,57 @@ logger = logging.getLogger(__name__)
 _client: AsyncOpenAI | None = None
 _ALLOWED_DIFFICULTIES = {level.value for level in DifficultyLevel}
 
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_NUM_PREFIX_RE = re.compile(r"^\d+[\.\)]\s*")
+_KOREAN_RE = re.compile(r"[가-힣]")
+_COPULA_SPACING_RE = re.compile(
+    r"(뭐|왜|어디|누구|이거|저거|그거|여기|거기)\s+(야|니|냐|지|죠)"
+)
+_AUXILIARY_SPACING_RE = re.compile(
+    r"([가-힣]+)\s+(줘(?:요)?|줬(?:어|어요)|줄(?:래|게|까)|주(?:라|면|고|지|세요))"
+)
+
+# snake_case payload keys -> camelCase fallbacks some model outputs use
+_CAMEL_KEYS = {
+    key: key.split("_")[0] + "".join(part.title() for part in key.split("_")[1:])
+    for key in ("target_word", "contrast_word", "target_sentence", "contrast_sentence")
+}
+
+# Larger batches are split into parallel calls of at most this many sentences;
+# LLM latency grows with output length, so several short calls finish sooner.
+_MAX_SENTENCES_PER_CALL = 15
+
 # Gemini API base URL for OpenAI compatibility
 GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/openai/"
 
+# Connection pool for the shared client; sized for parallel shards across
+# concurrent pipeline attempts and requests.
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+# Static system message sent first on every call; keeping it byte-identical
+# (and per-call variation at the end of the user prompt) lets the provider's
+# implicit prefix cache reuse it.
+_SYSTEM_PROMPT = (
+    "You are a helpful assistant that generates therapy sentences for children. "
+    "Always respond in valid JSON format."
+)
+
+# In-process LRU of generation results keyed by request + batch size
+# (used only when settings.generate_cache_enabled)
+_RESPONSE_CACHE: OrderedDict[str, "GenerateCandidatesResult"] = OrderedDict()
+
+# Shared futures for cache misses currently being generated, per event loop
+# (key -> future); concurrent misses on one key await the same LLM call
+_IN_FLIGHT_GENERATIONS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Future]
+] = weakref.WeakKeyDictionary()
+
+# Per-event-loop semaphores bounding in-flight LLM calls across shards and
+# attempts; asyncio primitives bind to one loop, so each loop gets its own
+_LLM_SEMAPHORES: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
 
 @dataclass
 class GenerateCandidatesResult:
@@ -45,7 +100,8 @@ def _get_client() -> AsyncOpenAI:
     """Get or create the Gemini client (via OpenAI compatibility layer).
 
     Uses lazy initialization to avoid creating the client
-    until it's actually needed.
+    until it's actually needed. The check-and-set below never awaits, so
+    concurrent coroutines on the event loop cannot create two clients.
 
     Returns:
         AsyncOpenAI client instance configured for Gemini.
@@ -60,25 +116,52 @@ def _get_client() -> AsyncOpenAI:
         _client = AsyncOpenAI(
             api_key=settings.gemini_api_key,
             base_url=GEMINI_BASE_URL,
+            http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS),
         )
     return _client
 
 
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Get the LLM concurrency semaphore for the running event loop.
+
+    Created lazily per loop (sized by ``settings.llm_max_concurrency``) so
+    test loops, reloads and workers never share a semaphore bound to
+    another loop.
+
+    Returns:
+        asyncio.Semaphore for the current loop.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _LLM_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+        _LLM_SEMAPHORES[loop] = semaphore
+    return semaphore
+
+
 async def generate_candidates(
     request: GenerateRequestV2,
     batch_size: int | None = None,
+    use_cache: bool = True,
 ) -> GenerateCandidatesResult:
     """Generate candidate therapy sentences using LLM.
 
     This function builds a prompt based on the generation request and
     calls the OpenAI API to generate candidate sentences. The generated
-    sentences are then normalized and returned.
+    sentences are then normalized and returned. Batches larger than
+    _MAX_SENTENCES_PER_CALL are split into parallel calls and merged; a
+    failed call only loses its own shard unless every call fails. When
+    ``settings.generate_cache_enabled`` is set, non-empty results for an
+    identical request and batch size are served from an in-process LRU,
+    and concurrent misses for the same key share one LLM call.
 
     Args:
         request: The generation request containing language, age, target
             phoneme, diagnosis, therapy approach, and other parameters.
         batch_size: Number of sentences to generate. Defaults to count * 3
             to provide enough candidates for filtering.
+        use_cache: Whether the response cache may be used. Retries pass
+            False so they always sample new candidates.
 
     Returns:
         GenerateCandidatesResult with candidates and optional contrast sets.
@@ -107,8 +190,146 @@ async def generate_candidates(
     if batch_size is None:
         batch_size = request.count * 3
 
+    if not (use_cache and settings.generate_cache_enabled):
+        return await _generate_uncached(request, batch_size)
+
+    key = _cache_key(request, batch_size)
+    cached = _RESPONSE_CACHE.get(key)
+    if cached is not None:
+        _RESPONSE_CACHE.move_to_end(key)
+        logger.info(f"[LLM] 캐시 적중 - {len(cached.candidates)}개")
+        return copy.deepcopy(cached)
+
+    # 같은 키의 동시 미스는 하나의 LLM 호출을 공유
+    in_flight = _IN_FLIGHT_GENERATIONS.setdefault(asyncio.get_running_loop(), {})
+    shared = in_flight.get(key)
+    if shared is None:
+        shared = asyncio.ensure_future(_generate_and_cache(request, batch_size, key))
+        in_flight[key] = shared
+        shared.add_done_callback(partial(_finish_in_flight, in_flight, key))
+    # 한 호출자가 취소되어도 공유 호출은 다른 대기자를 위해 계속 진행
+    result = await asyncio.shield(shared)
+    return copy.deepcopy(result)
+
+
+async def _generate_and_cache(
+    request: GenerateRequestV2,
+    batch_size: int,
+    key: str,
+) -> GenerateCandidatesResult:
+    """Generate uncached and store non-empty results in the response cache."""
+    result = await _generate_uncached(request, batch_size)
+    if result.candidates:
+        _RESPONSE_CACHE[key] = copy.deepcopy(result)
+        while len(_RESPONSE_CACHE) > settings.generate_cache_size:
+            _RESPONSE_CACHE.popitem(last=False)
+    return result
+
+
+def _finish_in_flight(
+    in_flight: dict[str, asyncio.Future],
+    key: str,
+    future: asyncio.Future,
+) -> None:
+    """Forget a finished shared generation and mark its exception as retrieved."""
+    in_flight.pop(key, None)
+    if not future.cancelled():
+        future.exception()
+
+
+def _cache_key(request: GenerateRequestV2, batch_size: int) -> str:
+    """Stable cache key for a generation request and batch size."""
+    payload = orjson.dumps(
+        [request.model_dump(mode="json"), batch_size], option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+async def _generate_uncached(
+    request: GenerateRequestV2,
+    batch_size: int,
+) -> GenerateCandidatesResult:
+    """Generate a batch via the LLM, splitting it into parallel calls if large."""
+    shard_sizes = _split_batch_size(batch_size)
+    if len(shard_sizes) == 1:
+        return await _generate_batch(request, batch_size)
+
+    logger.info(f"[LLM] {len(shard_sizes)}개 호출로 분할 - sizes={shard_sizes}")
+    results = await asyncio.gather(
+        *(
+            _generate_batch(request, size, shard_index=i)
+            for i, size in enumerate(shard_sizes)
+        ),
+        return_exceptions=True,
+    )
+
+    candidates: list[dict] = []
+    contrast_sets: list[dict] = []
+    errors: list[BaseException] = []
+    seen: set[str] = set()
+    seen_pairs: set[tuple[str, str]] = set()
+    for result in results:
+        if isinstance(result, BaseException):
+            errors.append(result)
+            continue
+        # 각 호출 내부 중복은 이미 제거됨; 호출 간 중복만 거름
+        for candidate in result.candidates:
+            if candidate["sentence"] not in seen:
+                seen.add(candidate["sentence"])
+                candidates.append(candidate)
+        for contrast_set in result.contrast_sets or ():
+            pair = (contrast_set["targetSentence"]["text"], contrast_set["contrastSentence"]["text"])
+            if pair not in seen_pairs:
+                seen_pairs.add(pair)
+                contrast_sets.append(contrast_set)
+
+    if len(errors) == len(results):
+        raise errors[0]
+    if errors:
+        logger.warning(f"[LLM] {len(errors)}/{len(results)}개 호출 실패, 나머지 결과 사용")
+
+    return GenerateCandidatesResult(
+        candidates=candidates, contrast_sets=contrast_sets or None
+    )
+
+
+def _split_batch_size(batch_size: int) -> list[int]:
+    """Split a batch size into near-equal shards of at most _MAX_SENTENCES_PER_CALL.
+
+    Example:
+        >>> _split_batch_size(45)
+        [15, 15, 15]
+        >>> _split_batch_size(20)
+        [10, 10]
+    """
+    shards = max(1, -(-batch_size // _MAX_SENTENCES_PER_CALL))
+    base, extra = divmod(batch_size, shards)
+    return [base + (1 if i < extra else 0) for i in range(shards)]
+
+
+async def _generate_batch(
+    request: GenerateRequestV2,
+    batch_size: int,
+    shard_index: int = 0,
+) -> GenerateCandidatesResult:
+    """Generate one batch of candidates with a single LLM call.
+
+    Args:
+        request: The generation request.
+        batch_size: Number of sentences to request in this call.
+        shard_index: Position of this call when a batch is split; non-zero
+            shards get a short variation hint to reduce duplicates.
+
+    Returns:
+        GenerateCandidatesResult parsed from the LLM response.
+    """
     prompt_start = time.time()
     prompt = build_generation_prompt(request, batch_size)
+    if shard_index:
+        prompt += (
+            f"\n\n(Batch {shard_index + 1}: vary vocabulary and sentence "
+            "structure so this batch does not repeat other batches.)"
+        )
     prompt_time = int((time.time() - prompt_start) * 1000)
     prompt_len = len(prompt)
 
@@ -121,21 +342,22 @@ async def generate_candidates(
         f"prompt_len={prompt_len}, batch_size={batch_size}"
     )
 
-    system_prompt = "You are a helpful assistant that generates therapy sentences for children. Always respond in valid JSON format."
-
     llm_start = time.time()
     try:
-        response = await client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt},
-            ],
-            response_format={"type": "json_object"},
-            timeout=60.0,
-        )
+        async with _get_llm_semaphore():
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": _SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt},
+                ],
+                response_format={"type": "json_object"},
+                timeout=60.0,
+            )
         llm_time = int((time.time() - llm_start) * 1000)
-        logger.info(f"[LLM] 응답 수신 - {llm_time}ms")
+        logger.info(
+            f"[LLM] 응답 수신 - {llm_time}ms, cached_tokens={_cached_prompt_tokens(response)}"
+        )
     except Exception as e:
         llm_time = int((time.time() - llm_start) * 1000)
         logger.error(f"[LLM] API 호출 실패 - {llm_time}ms, error: {type(e).__name__}: {e}")
@@ -151,7 +373,7 @@ async def generate_candidates(
 
     parse_start = time.time()
     try:
-        data = json.loads(content)
+        data = orjson.loads(_strip_code_fence(content))
         sentences: list[dict] = []
         contrast_sets: list[dict] = []
         parse_format = "unknown"
@@ -177,6 +399,7 @@ async def generate_candidates(
         # contrast 모드용 tokens 기반 형식: {"sets": [...]}
         elif "sets" in data:
             parse_format = "sets"
+            seen_pairs: set[tuple[str, str]] = set()
             for s in data["sets"]:
                 target_sentence = _build_tokenized_sentence(s, "target_sentence")
                 contrast_sentence = _build_tokenized_sentence(s, "contrast_sentence")
@@ -187,6 +410,11 @@ async def generate_candidates(
                     sentences.append({"sentence": contrast_sentence["text"]})
 
                 if target_sentence and contrast_sentence:
+                    # 같은 문장 쌍이 반복되면 첫 세트만 유지
+                    pair = (target_sentence["text"], contrast_sentence["text"])
+                    if pair in seen_pairs:
+                        continue
+                    seen_pairs.add(pair)
                     contrast_sets.append(
                         {
                             "targetWord": _get_contrast_word(s, "target_word"),
@@ -210,31 +438,62 @@ async def generate_candidates(
             samples = sentences[:3]
             logger.debug(f"[LLM] 샘플: {samples}")
 
+        # sets 형식의 문장은 _build_tokenized_sentence에서 이미 정규화됨
+        already_normalized = parse_format == "sets"
+        # 정규화 결과 기준으로 중복/빈 문장을 제거 (LLM이 같은 문장을 반복하는 경우)
+        seen: set[str] = set()
         normalized = []
         for item in sentences:
             sentence = item.get("sentence")
             if not isinstance(sentence, str):
                 continue
-            normalized_item = {
-                "sentence": _normalize_sentence(sentence),
-            }
+            if not already_normalized:
+                sentence = _normalize_sentence(sentence)
+            if not sentence or sentence in seen:
+                continue
+            seen.add(sentence)
+            normalized_item = {"sentence": sentence}
             difficulty = item.get("difficulty")
             if isinstance(difficulty, str) and difficulty in _ALLOWED_DIFFICULTIES:
                 normalized_item["difficulty"] = difficulty
             normalized.append(normalized_item)
-        if contrast_sets:
-            _normalize_contrast_sets(contrast_sets)
         return GenerateCandidatesResult(candidates=normalized, contrast_sets=contrast_sets or None)
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         parse_time = int((time.time() - parse_start) * 1000)
         logger.warning(f"[LLM] JSON 파싱 실패 - {parse_time}ms, error: {e}")
         logger.debug(f"[LLM] 원본 응답: {content[:500]}...")
-        # Fallback: try to extract quoted strings
-        matches = re.findall(r'"([^"]+)"', content)
-        logger.info(f"[LLM] Fallback 파싱 - {len(matches)}개 추출")
-        return GenerateCandidatesResult(
-            candidates=[{"sentence": _normalize_sentence(m)} for m in matches]
-        )
+        # Fallback: try to extract quoted strings, dropping duplicates
+        seen: set[str] = set()
+        candidates: list[dict] = []
+        for match in _QUOTED_RE.finditer(content):
+            sentence = _normalize_sentence(match.group(1))
+            if not sentence or sentence in seen:
+                continue
+            seen.add(sentence)
+            candidates.append({"sentence": sentence})
+        logger.info(f"[LLM] Fallback 파싱 - {len(candidates)}개 추출")
+        return GenerateCandidatesResult(candidates=candidates)
+
+
+def _cached_prompt_tokens(response) -> int:
+    """Return prompt tokens served from the provider's prefix cache (0 if unreported)."""
+    usage = getattr(response, "usage", None)
+    details = getattr(usage, "prompt_tokens_details", None)
+    return getattr(details, "cached_tokens", None) or 0
+
+
+def _strip_code_fence(content: str) -> str:
+    """Remove a surrounding Markdown code fence (```json ... ```) if present.
+
+    Example:
+        >>> _strip_code_fence('```json\n{"items": []}\n```')
+        '{"items": []}'
+    """
+    s = content.strip()
+    if not s.startswith("```"):
+        return content
+    s = s.removeprefix("```json").removeprefix("```").removesuffix("```")
+    return s.strip()
 
 
 def _normalize_sentence(sentence: str) -> str:
@@ -256,11 +515,13 @@ def _normalize_sentence(sentence: str) -> str:
         '안녕하세요'
     """
     s = sentence.strip()
-    # Remove numbering like "1. " or "1) "
-    s = re.sub(r"^\d+[\.\)]\s*", "", s)
+    # Remove numbering like "1. " or "1) " (most sentences have none)
+    if s and s[0].isdigit():
+        s = _NUM_PREFIX_RE.sub("", s, count=1)
     # Remove surrounding quotes
-    s = s.strip("\"'")
-    if re.search(r"[가-힣]", s):
+    if s and (s[0] in "\"'" or s[-1] in "\"'"):
+        s = s.strip("\"'")
+    if _KOREAN_RE.search(s):
         s = _normalize_korean_spacing(s)
     return s
 
@@ -269,17 +530,9 @@ def _normalize_korean_spacing(text: str) -> str:
     """Normalize common Korean spacing artifacts from model outputs."""
     s = text
     # Join copula/question endings like "뭐 야" -> "뭐야"
-    s = re.sub(
-        r"(뭐|왜|어디|누구|이거|저거|그거|여기|거기)\s+(야|니|냐|지|죠)",
-        r"\1\2",
-        s,
-    )
+    s = _COPULA_SPACING_RE.sub(r"\1\2", s)
     # Join auxiliary forms like "해 줘" -> "해줘", "보여 줘요" -> "보여줘요"
-    s = re.sub(
-        r"([가-힣]+)\s+(줘(?:요)?|줬(?:어|어요)|줄(?:래|게|까)|주(?:라|면|고|지|세요))",
-        r"\1\2",
-        s,
-    )
+    s = _AUXILIARY_SPACING_RE.sub(r"\1\2", s)
     return s
 
 
@@ -293,11 +546,17 @@ def _build_tokenized_sentence(payload: dict, key: str) -> dict | None:
     if not isinstance(tokens, list) or not tokens:
         return None
 
-    cleaned_tokens = [str(token) for token in tokens if isinstance(token, (str, int, float))]
+    if all(isinstance(token, str) for token in tokens):
+        # Common case: the model already returned string tokens
+        cleaned_tokens = list(tokens)
+    else:
+        cleaned_tokens = [
+            str(token) for token in tokens if isinstance(token, (str, int, float))
+        ]
     if not cleaned_tokens:
         return None
 
-    text = " ".join(cleaned_tokens)
+    text = _normalize_sentence(" ".join(cleaned_tokens))
     return {
         "text": text,
         "tokens": cleaned_tokens,
@@ -305,16 +564,8 @@ def _build_tokenized_sentence(payload: dict, key: str) -> dict | None:
 
 
 def _get_contrast_word(payload: dict, key: str) -> str:
-    if key in payload and isinstance(payload[key], str):
-        return payload[key]
-    camel_key = "".join([key.split("_")[0]] + [part.title() for part in key.split("_")[1:]])
-    value = payload.get(camel_key)
+    value = payload.get(key)
+    if isinstance(value, str):
+        return value
+    value = payload.get(_CAMEL_KEYS[key])
     return value if isinstance(value, str) else ""
-
-
-def _normalize_contrast_sets(contrast_sets: list[dict]) -> None:
-    for contrast_set in contrast_sets:
-        for sentence_key in ("targetSentence", "contrastSentence"):
-            sentence = contrast_set.get(sentence_key)
-            if isinstance(sentence, dict) and isinstance(sentence.get("text"), str):
-                sentence["text"] = _normalize_sentence(sentence["text"])
@@ -7,7 +7,10 @@
 다양성 페널티: 이미 선택된 문장과 구조/어휘가 유사하면 점수 차감
 """
 
-from dataclasses import dataclass
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from operator import attrgetter, itemgetter
 import re
 
 from app.api.v2.schemas import (
@@ -16,9 +19,19 @@ from app.api.v2.schemas import (
     CommunicativeFunction,
     TherapyApproach,
 )
-from app.services.corpus.korean_freq import get_sentence_frequency_score
+from app.agents.tools.validate import ValidationResult
+from app.services.corpus.korean_freq import get_sentence_frequency_scores
 
 
+# 어절(공백 구분 토큰) 패턴
+_TOKEN_RE = re.compile(r"\S+")
+
+# 다양성 페널티 계산 시 비교할 상위 문장 수
+_DIVERSITY_COMPARE_COUNT = 10
+
+# 길이 적합성 점수 (검증 단계에서 길이 조건을 보장하므로 항상 만점)
+_LENGTH_FIT = 100.0
+
 # 한국어 조사 패턴 (구조 추출용)
 _KO_PARTICLES = [
     "은", "는", "이", "가", "을", "를", "에", "에서", "으로", "로",
@@ -33,6 +46,16 @@ _KO_NOUN_ENDINGS = [
 ]
 
 
+def _compile_suffix_re(suffixes: list[str]) -> re.Pattern[str]:
+    """앞에 한 글자 이상 남는 가장 긴 접미사를 찾는 정규식을 만듭니다."""
+    ordered = sorted(suffixes, key=len, reverse=True)
+    return re.compile("(?<=.)(" + "|".join(map(re.escape, ordered)) + ")$")
+
+
+_KO_PARTICLE_RE = _compile_suffix_re(_KO_PARTICLES)
+_KO_NOUN_ENDING_RE = _compile_suffix_re(_KO_NOUN_ENDINGS)
+
+
 def _extract_sentence_structure(sentence: str, language: Language) -> str:
     """문장의 구조 패턴을 추출합니다.
 
@@ -54,14 +77,10 @@ def _extract_sentence_structure(sentence: str, language: Language) -> str:
 
     for word in words:
         # 조사로 끝나는지 확인
-        found_particle = None
-        for particle in sorted(_KO_PARTICLES, key=len, reverse=True):
-            if word.endswith(particle) and len(word) > len(particle):
-                found_particle = particle
-                break
-
-        if found_particle:
-            structure_parts.append(f"N{found_particle}")
+        particle_match = _KO_PARTICLE_RE.search(word)
+
+        if particle_match:
+            structure_parts.append(f"N{particle_match.group(1)}")
         elif word.endswith(("요", "어", "아", "야", "다", "지", "네", "래")):
             structure_parts.append("V")
         elif word.endswith(("!", "?", "~")):
@@ -94,11 +113,8 @@ def _extract_nouns(sentence: str, language: Language) -> set[str]:
 
     for word in words:
         # 조사 제거
-        noun = word
-        for ending in sorted(_KO_NOUN_ENDINGS, key=len, reverse=True):
-            if word.endswith(ending) and len(word) > len(ending):
-                noun = word[:-len(ending)]
-                break
+        ending_match = _KO_NOUN_ENDING_RE.search(word)
+        noun = word[: ending_match.start()] if ending_match else word
 
         # 너무 짧은 건 제외 (조사만 남은 경우)
         if len(noun) >= 2:
@@ -108,49 +124,36 @@ def _extract_nouns(sentence: str, language: Language) -> set[str]:
 
 
 def _calculate_diversity_penalty(
-    sentence: str,
-    already_scored: list["ScoredSentence"],
-    language: Language,
+    structure: int,
+    nouns: frozenset[int],
+    structure_counts: Counter[int],
+    noun_counts: Counter[int],
 ) -> float:
     """다양성 페널티를 계산합니다.
 
     이미 점수가 높은 문장들과 구조/어휘가 유사하면 페널티를 부여합니다.
+    비교 대상 문장들은 구조 ID별 개수와 명사 ID별 등장 문장 수로 누적해 두므로,
+    문장마다 비교 대상과 하나씩 교집합을 구하지 않아도 됩니다.
 
     Args:
-        sentence: 현재 문장
-        already_scored: 이미 점수 매긴 문장들 (점수순)
-        language: 언어
+        structure: 현재 문장의 구조 패턴 ID
+        nouns: 현재 문장의 명사 ID 집합
+        structure_counts: 비교 대상 문장들의 구조 ID별 개수
+        noun_counts: 비교 대상 문장들 중 각 명사 ID를 포함한 문장 수
 
     Returns:
         페널티 점수 (0 이상, 높을수록 나쁨)
     """
-    if not already_scored:
-        return 0.0
-
-    penalty = 0.0
-    current_structure = _extract_sentence_structure(sentence, language)
-    current_nouns = _extract_nouns(sentence, language)
-
-    # 상위 10개 문장과만 비교 (성능 고려)
-    compare_count = min(10, len(already_scored))
+    # 구조 유사도 페널티 (같은 구조 문장 1개당 10점)
+    penalty = structure_counts[structure] * 10.0
 
-    for scored in already_scored[:compare_count]:
-        other_structure = _extract_sentence_structure(scored.sentence, language)
-        other_nouns = _extract_nouns(scored.sentence, language)
-
-        # 구조 유사도 페널티
-        if current_structure == other_structure:
-            penalty += 10.0
-
-        # 어휘 중복 페널티 (중복 명사 1개당 5점)
-        if current_nouns and other_nouns:
-            overlap = current_nouns & other_nouns
-            penalty += len(overlap) * 5.0
+    # 어휘 중복 페널티 (비교 대상 문장별 중복 명사 1개당 5점)
+    penalty += sum(noun_counts[noun] for noun in nouns) * 5.0
 
     return penalty
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoredSentence:
     """점수가 부여된 문장.
 
@@ -158,16 +161,18 @@ class ScoredSentence:
         sentence: 문장 텍스트
         matched_words: 타깃 음소 포함 단어들
         word_count: 단어/어절 수
-        difficulty: 난이도 (옵션)
         score: 종합 점수 (0-100)
         breakdown: 점수 breakdown (frequency, function, match_bonus, length_fit)
+        difficulty: 난이도 (옵션)
+        matched_word_positions: 매칭 단어별 (단어, 시작 인덱스, 끝 인덱스)
     """
     sentence: str
     matched_words: list[str]
     word_count: int
-    difficulty: str | None
     score: float
     breakdown: dict[str, float]
+    difficulty: str | None = None
+    matched_word_positions: list[tuple[str, int, int]] = field(default_factory=list)
 
 
 # 의사소통 기능 패턴 (한국어)
@@ -193,6 +198,37 @@ FUNCTION_PATTERNS_KO = {
 }
 
 
+def _prune_literal_alternatives(patterns: list[str]) -> str:
+    """기능 패턴들을 하나의 alternation으로 합치며 중복 리터럴을 제거합니다.
+
+    기능 판별은 매칭 여부만 보므로, 다른 리터럴을 부분 문자열로 포함하는
+    리터럴(예: "싶어요" ⊃ "싶어")은 결과에 영향이 없어 제거합니다.
+    정규식 메타문자가 있는 대안(예: "하고\\s*싶")은 그대로 둡니다.
+
+    Args:
+        patterns: 기능별 정규식 문자열 리스트
+
+    Returns:
+        합쳐진 정규식 문자열
+    """
+    alternatives = [alt for pattern in patterns for alt in pattern.split("|")]
+    literals = [alt for alt in alternatives if re.escape(alt) == alt]
+    kept = [
+        alt
+        for alt in alternatives
+        if alt not in literals
+        or not any(other != alt and other in alt for other in literals)
+    ]
+    return "|".join(dict.fromkeys(kept))
+
+
+# 기능별 패턴을 하나의 정규식으로 합쳐 미리 컴파일 (문장당 한 번만 탐색)
+_COMPILED_FUNCTION_PATTERNS_KO: dict[CommunicativeFunction, re.Pattern[str]] = {
+    function: re.compile(_prune_literal_alternatives(patterns))
+    for function, patterns in FUNCTION_PATTERNS_KO.items()
+}
+
+
 BASE_SCORE_WEIGHTS = {
     "frequency": 0.4,
     "function": 0.3,
@@ -230,22 +266,78 @@ def score_sentences(
         >>> results[0].score > 0
         True
     """
+    return _score_rows(
+        (
+            (item["sentence"], item["matched_words"], item["word_count"], item.get("difficulty"))
+            for item in validated
+        ),
+        request,
+    )
+
+
+def score_validation_results(
+    results: Iterable[ValidationResult],
+    request: GenerateRequestV2,
+) -> list[ScoredSentence]:
+    """검증 결과 중 통과한 문장들에 바로 점수를 부여합니다.
+
+    get_passed_sentences로 중간 딕셔너리를 만들지 않고 ValidationResult에서
+    필요한 값만 읽습니다. 점수 계산 방식은 score_sentences와 같습니다.
+
+    Args:
+        results: ValidationResult들 (통과하지 못한 결과는 건너뜀)
+        request: 생성 요청
+
+    Returns:
+        점수순 정렬된 ScoredSentence 리스트 (다양성 고려)
+    """
+    return _score_rows(
+        (
+            (r.sentence, r.matched_words, r.word_count, r.difficulty)
+            for r in results
+            if r.passed
+        ),
+        request,
+    )
+
+
+def _score_rows(
+    rows: Iterable[tuple[str, list[str], int, str | None]],
+    request: GenerateRequestV2,
+) -> list[ScoredSentence]:
+    """(문장, 매칭 단어, 단어 수, 난이도) 행들에 점수를 부여합니다."""
     # 1차: 기본 점수 계산
     preliminary_results = []
 
-    for item in validated:
-        sentence = item["sentence"]
-        matched_words = item["matched_words"]
-        word_count = item["word_count"]
-        difficulty = item.get("difficulty")
+    # 가중치는 요청에만 의존하므로 한 번만 계산
+    weights = _get_score_weights(request)
+    w_frequency = weights["frequency"]
+    w_function = weights["function"]
+    w_match_bonus = weights["match_bonus"]
+    # 길이 적합성은 검증 단계에서 보장되므로 상수 기여분으로 처리
+    length_contribution = _LENGTH_FIT * weights["length_fit"]
+
+    # 같은 문장은 첫 번째 것만 점수화 (재시도 간 중복 생성 시 자기 자신과의 다양성 페널티 방지)
+    seen_sentences: set[str] = set()
+    unique_rows = []
+    for row in rows:
+        if row[0] not in seen_sentences:
+            seen_sentences.add(row[0])
+            unique_rows.append(row)
+
+    # 빈도 점수는 배치 단위로 한 번에 계산 (영어는 추후 구현)
+    if request.language == Language.KO:
+        frequencies = get_sentence_frequency_scores([row[0] for row in unique_rows])
+    else:
+        frequencies = [50.0] * len(unique_rows)
 
-        breakdown = _calculate_breakdown(sentence, matched_words, request)
-        weights = _get_score_weights(request)
+    for (sentence, matched_words, word_count, difficulty), frequency in zip(unique_rows, frequencies):
+        breakdown = _calculate_breakdown(sentence, matched_words, request, frequency)
         base_score = (
-            breakdown["frequency"] * weights["frequency"]
-            + breakdown["function"] * weights["function"]
-            + breakdown["match_bonus"] * weights["match_bonus"]
-            + breakdown["length_fit"] * weights["length_fit"]
+            breakdown["frequency"] * w_frequency
+            + breakdown["function"] * w_function
+            + breakdown["match_bonus"] * w_match_bonus
+            + length_contribution
         )
 
         preliminary_results.append({
@@ -258,24 +350,43 @@ def score_sentences(
         })
 
     # 기본 점수순 정렬
-    preliminary_results.sort(key=lambda x: x["base_score"], reverse=True)
+    preliminary_results.sort(key=itemgetter("base_score"), reverse=True)
 
     # 2차: 다양성 페널티 적용하면서 최종 결과 생성
     final_results: list[ScoredSentence] = []
+    # 비교 대상이 되는 상위 문장들의 구조/명사 누적 카운트. 문장당 한 번만 추출
+    # 구조/명사 문자열은 정수 ID로 바꿔 카운트 조회를 정수 키로 처리
+    reference_count = 0
+    structure_counts: Counter[int] = Counter()
+    noun_counts: Counter[int] = Counter()
+    structure_ids: dict[str, int] = {}
+    noun_ids: dict[str, int] = {}
 
     for item in preliminary_results:
         # 이미 선택된 문장들과 비교하여 다양성 페널티 계산
+        structure = structure_ids.setdefault(
+            _extract_sentence_structure(item["sentence"], request.language),
+            len(structure_ids),
+        )
+        nouns = frozenset(
+            noun_ids.setdefault(noun, len(noun_ids))
+            for noun in _extract_nouns(item["sentence"], request.language)
+        )
         diversity_penalty = _calculate_diversity_penalty(
-            item["sentence"],
-            final_results,
-            request.language,
+            structure, nouns, structure_counts, noun_counts
         )
+        # 비교 대상은 점수순 상위 문장들로 고정되므로 한도까지만 누적
+        if reference_count < _DIVERSITY_COMPARE_COUNT:
+            reference_count += 1
+            structure_counts[structure] += 1
+            noun_counts.update(nouns)
 
         # 페널티 적용 (최대 50점까지만 차감)
         final_score = max(0, item["base_score"] - min(diversity_penalty, 50))
 
-        # breakdown에 다양성 페널티 추가
-        breakdown = item["breakdown"].copy()
+        # breakdown에 길이 적합성과 다양성 페널티 추가
+        breakdown = item["breakdown"]
+        breakdown["length_fit"] = _LENGTH_FIT
         breakdown["diversity_penalty"] = -round(diversity_penalty, 2)
 
         final_results.append(ScoredSentence(
@@ -285,13 +396,50 @@ def score_sentences(
             difficulty=item["difficulty"],
             score=round(final_score, 2),
             breakdown=breakdown,
+            matched_word_positions=_locate_matched_words(
+                item["sentence"], item["matched_words"]
+            ),
         ))
 
     # 최종 점수순 재정렬
-    final_results.sort(key=lambda x: x.score, reverse=True)
+    final_results.sort(key=attrgetter("score"), reverse=True)
     return final_results
 
 
+def _locate_matched_words(
+    sentence: str,
+    matched_words: list[str],
+) -> list[tuple[str, int, int]]:
+    """매칭 단어들의 문장 내 위치를 계산합니다.
+
+    매칭 단어는 대부분 문장의 어절 그대로이므로 어절 시작 위치를 한 번에
+    색인하고, 정제된 단어(영어 등)만 부분 문자열로 탐색합니다.
+    문장에서 찾을 수 없는 단어는 제외됩니다.
+
+    Args:
+        sentence: 문장
+        matched_words: 매칭된 단어들
+
+    Returns:
+        (단어, 시작 인덱스, 끝 인덱스) 튜플 리스트
+    """
+    if not matched_words:
+        return []
+
+    token_offsets: dict[str, int] = {}
+    for match in _TOKEN_RE.finditer(sentence):
+        token_offsets.setdefault(match.group(), match.start())
+
+    positions = []
+    for word in matched_words:
+        start = token_offsets.get(word)
+        if start is None:
+            start = sentence.find(word)
+        if start >= 0:
+            positions.append((word, start, start + len(word)))
+    return positions
+
+
 def _get_score_weights(request: GenerateRequestV2) -> dict[str, float]:
     """요청 조건에 맞는 점수 가중치 반환.
 
@@ -325,6 +473,7 @@ def _calculate_breakdown(
     sentence: str,
     matched_words: list[str],
     request: GenerateRequestV2,
+    frequency: float,
 ) -> dict[str, float]:
     """점수 breakdown 계산.
 
@@ -332,34 +481,23 @@ def _calculate_breakdown(
         sentence: 문장
         matched_words: 매칭된 단어들
         request: 요청 정보
+        frequency: 미리 계산한 문장 빈도 점수
 
     Returns:
-        각 항목별 점수 딕셔너리
+        각 항목별 점수 딕셔너리 (length_fit 제외, 최종 결과 생성 시 추가)
     """
-    # 1. 빈도 점수
-    if request.language == Language.KO:
-        frequency = get_sentence_frequency_score(sentence)
-    else:
-        frequency = 50.0  # 영어는 추후 구현
-
-    # 2. 기능 점수
+    # 1. 기능 점수
     function = 0.0
     if request.communicativeFunction and request.language == Language.KO:
-        patterns = FUNCTION_PATTERNS_KO.get(request.communicativeFunction, [])
-        for pattern in patterns:
-            if re.search(pattern, sentence):
-                function = 100.0
-                break
+        pattern = _COMPILED_FUNCTION_PATTERNS_KO.get(request.communicativeFunction)
+        if pattern is not None and pattern.search(sentence):
+            function = 100.0
 
-    # 3. 매칭 보너스 (다중 매칭 시 가산)
+    # 2. 매칭 보너스 (다중 매칭 시 가산)
     match_bonus = min(len(matched_words) * 30, 100)
 
-    # 4. 길이 적합성 (항상 100, 이미 검증됨)
-    length_fit = 100.0
-
     return {
         "frequency": round(frequency, 2),
         "function": function,
         "match_bonus": float(match_bonus),
-        "length_fit": length_fit,
     }
@@ -3,9 +3,12 @@
 생성된 문장들의 하드 제약(길이, 음소)을 검사합니다.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 import string
+import threading
 
 from app.api.v2.schemas import (
     GenerateRequestV2,
@@ -14,8 +17,8 @@ from app.api.v2.schemas import (
     TherapyApproach,
     DifficultyLevel,
 )
-from app.services.phoneme.korean import find_phoneme_matches
-from app.services.phoneme.english import find_phoneme_matches_en
+from app.services.phoneme.korean import find_phoneme_matches_cached
+from app.services.phoneme.english import find_phoneme_matches_en_cached
 from app.services.lexical.core_vocabulary import resolve_core_words
 
 
@@ -61,6 +64,16 @@ _KO_STEM_GROUPS: dict[str, list[str]] = {
     "기쁘": ["기쁘", "기쁜", "기뻐"],
 }
 
+# 활용형 → 대표 어간 매핑과 전체 활용형을 한 번에 찾는 패턴 (긴 활용형 우선)
+_KO_STEM_VARIANT_TO_REP: dict[str, str] = {
+    variant: representative
+    for representative, variants in _KO_STEM_GROUPS.items()
+    for variant in variants
+}
+_KO_STEM_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(_KO_STEM_VARIANT_TO_REP, key=len, reverse=True)))
+)
+
 
 def _extract_korean_stems(text: str) -> list[str]:
     """한국어 문장에서 형용사/동사 어간을 추출합니다.
@@ -73,21 +86,12 @@ def _extract_korean_stems(text: str) -> list[str]:
         text: 분석할 문장
 
     Returns:
-        추출된 대표 어간 리스트
+        추출된 대표 어간 리스트 (문장 내 등장 순서)
     """
-    stems = []
-
-    # 각 어간 그룹에서 활용형 검색
-    for representative, variants in _KO_STEM_GROUPS.items():
-        count = 0
-        for variant in variants:
-            count += len(re.findall(re.escape(variant), text))
-        # 해당 어간 그룹이 발견된 횟수만큼 대표 어간 추가
-        stems.extend([representative] * count)
-
-    return stems
+    return [_KO_STEM_VARIANT_TO_REP[match] for match in _KO_STEM_PATTERN.findall(text)]
 
 
+@lru_cache(maxsize=8192)
 def _check_semantic_repetition(sentence: str, language: Language) -> str | None:
     """의미 반복을 검사합니다.
 
@@ -104,17 +108,13 @@ def _check_semantic_repetition(sentence: str, language: Language) -> str | None:
     if language != Language.KO:
         return None
 
-    stems = _extract_korean_stems(sentence)
-
-    # 어간별 출현 횟수 계산
-    stem_counts: dict[str, int] = {}
-    for stem in stems:
-        stem_counts[stem] = stem_counts.get(stem, 0) + 1
-
-    # 2회 이상 등장하는 어간 찾기
-    for stem, count in stem_counts.items():
-        if count >= 2:
+    # 한 번 스캔하면서 두 번째로 등장하는 어간이 나오면 바로 반환
+    seen_stems: set[str] = set()
+    for match in _KO_STEM_PATTERN.finditer(sentence):
+        stem = _KO_STEM_VARIANT_TO_REP[match.group()]
+        if stem in seen_stems:
             return stem
+        seen_stems.add(stem)
 
     return None
 
@@ -134,7 +134,11 @@ _KO_PREDICATE_ENDINGS = [
     "니", "냐", "까",
 ]
 
+# str.endswith에 한 번에 넘기기 위한 튜플
+_KO_PREDICATE_ENDINGS_TUPLE = tuple(_KO_PREDICATE_ENDINGS)
 
+
+@lru_cache(maxsize=8192)
 def _check_has_predicate(sentence: str, language: Language) -> bool:
     """문장에 서술어가 있는지 검사합니다.
 
@@ -153,23 +157,13 @@ def _check_has_predicate(sentence: str, language: Language) -> bool:
 
     text = sentence.strip()
 
-    # 문장부호 제거 후 검사
-    for ending in _KO_PREDICATE_ENDINGS:
-        if text.endswith(ending):
-            return True
-
-    # 마지막 토큰 검사
-    words = text.split()
-    if words:
-        last_word = words[-1].rstrip("!?~.")
-        for ending in _KO_PREDICATE_ENDINGS:
-            if last_word.endswith(ending):
-                return True
-
-    return False
+    # 그대로 검사한 뒤, 어미 뒤 문장부호(!?~.)를 떼고 다시 검사
+    return text.endswith(_KO_PREDICATE_ENDINGS_TUPLE) or text.rstrip("!?~.").endswith(
+        _KO_PREDICATE_ENDINGS_TUPLE
+    )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """검증 결과.
 
@@ -189,6 +183,30 @@ class ValidationResult:
     fail_reason: str | None = None
 
 
+# 입력 딕셔너리에서 허용하는 난이도 값
+_ALLOWED_DIFFICULTIES = frozenset(level.value for level in DifficultyLevel)
+
+# 검증 결과 LRU 캐시: (문장, 난이도, 요청 시그니처) → ValidationResult
+# 재시도에서 같은 문장이 다시 생성되면 검증을 반복하지 않음.
+# 결과 객체는 호출 간에 공유됨 (ValidationResult는 frozen).
+# 파이프라인이 청크를 스레드 풀에서 병렬 검증하므로 락으로 보호
+_VALIDATION_CACHE: OrderedDict[tuple, ValidationResult] = OrderedDict()
+_VALIDATION_CACHE_SIZE = 4096
+_VALIDATION_CACHE_LOCK = threading.Lock()
+
+
+def _request_signature(request: GenerateRequestV2) -> tuple:
+    """검증 결과에 영향을 주는 요청 필드만 모은 해시 가능한 키를 만듭니다."""
+    target = request.target
+    return (
+        request.language,
+        request.sentenceLength,
+        request.therapyApproach,
+        (target.phoneme, target.position, target.minOccurrences) if target else None,
+        tuple(request.core_words) if request.core_words else None,
+    )
+
+
 def validate_sentences(
     sentences: list[str] | list[dict],
     request: GenerateRequestV2,
@@ -219,62 +237,108 @@ def validate_sentences(
         True
     """
     results = []
-    normalized = []
+    normalized = _normalize_input(sentences)
+
+    signature = _request_signature(request)
+    # 핵심 어휘는 요청 단위로 고정이므로 한 번만 정규화
+    core_words = (
+        _normalized_core_words(request)
+        if request.therapyApproach == TherapyApproach.CORE_VOCABULARY
+        else None
+    )
+    for sentence, difficulty in normalized:
+        # 길이 검사는 캐시 조회나 정규식 검사보다 먼저 일괄 처리
+        words = sentence.strip().split()
+        if len(words) != request.sentenceLength:
+            results.append(_word_count_failure(sentence, len(words), request, difficulty))
+            continue
+
+        key = (sentence, difficulty, signature)
+        with _VALIDATION_CACHE_LOCK:
+            result = _VALIDATION_CACHE.get(key)
+            if result is not None:
+                _VALIDATION_CACHE.move_to_end(key)
+        if result is None:
+            result = _validate_single(sentence, request, difficulty, words, core_words)
+            with _VALIDATION_CACHE_LOCK:
+                _VALIDATION_CACHE[key] = result
+                if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_SIZE:
+                    _VALIDATION_CACHE.popitem(last=False)
+        results.append(result)
 
-    allowed_difficulties = {level.value for level in DifficultyLevel}
+    return results
+
+
+def _normalize_input(sentences: list[str] | list[dict]) -> list[tuple[str, str | None]]:
+    """입력 문장들을 (문장, 난이도) 튜플로 정규화합니다.
 
+    문장이 문자열이 아닌 딕셔너리는 건너뛰고, 허용되지 않은 난이도는 None으로 바꿉니다.
+    """
+    normalized = []
     for item in sentences:
         if isinstance(item, str):
-            normalized.append({"sentence": item, "difficulty": None})
+            normalized.append((item, None))
         elif isinstance(item, dict):
             sentence = item.get("sentence")
             if not isinstance(sentence, str):
                 continue
             difficulty = item.get("difficulty")
-            if isinstance(difficulty, str) and difficulty not in allowed_difficulties:
+            if not isinstance(difficulty, str) or difficulty not in _ALLOWED_DIFFICULTIES:
                 difficulty = None
-            normalized.append({
-                "sentence": sentence,
-                "difficulty": difficulty if isinstance(difficulty, str) else None,
-            })
+            normalized.append((sentence, difficulty))
+    return normalized
 
-    for item in normalized:
-        result = _validate_single(item["sentence"], request, item.get("difficulty"))
-        results.append(result)
 
-    return results
+def _word_count_failure(
+    sentence: str,
+    word_count: int,
+    request: GenerateRequestV2,
+    difficulty: str | None,
+) -> ValidationResult:
+    """길이 조건 실패 결과를 만듭니다."""
+    return ValidationResult(
+        sentence=sentence,
+        passed=False,
+        matched_words=[],
+        word_count=word_count,
+        difficulty=difficulty,
+        fail_reason=f"word_count: expected {request.sentenceLength}, got {word_count}",
+    )
 
 
 def _validate_single(
     sentence: str,
     request: GenerateRequestV2,
     difficulty: str | None = None,
+    words: list[str] | None = None,
+    core_words: frozenset[str] | None = None,
 ) -> ValidationResult:
     """단일 문장 검증.
 
     Args:
         sentence: 검증할 문장
         request: 생성 요청
+        difficulty: 난이도 (옵션)
+        words: 미리 분리한 어절 리스트 (없으면 문장에서 분리)
+        core_words: 미리 정규화한 핵심 어휘 (없으면 요청에서 계산)
 
     Returns:
         ValidationResult
     """
+    # 반복 참조하는 요청 필드는 지역 변수로 한 번만 읽음
+    language = request.language
+    target = request.target
+
     # 1. 길이 검사
-    words = sentence.strip().split()
+    if words is None:
+        words = sentence.strip().split()
     word_count = len(words)
 
     if word_count != request.sentenceLength:
-        return ValidationResult(
-            sentence=sentence,
-            passed=False,
-            matched_words=[],
-            word_count=word_count,
-            difficulty=difficulty,
-            fail_reason=f"word_count: expected {request.sentenceLength}, got {word_count}",
-        )
+        return _word_count_failure(sentence, word_count, request, difficulty)
 
     # 2. 의미 반복 검사 (한국어만)
-    repeated_stem = _check_semantic_repetition(sentence, request.language)
+    repeated_stem = _check_semantic_repetition(sentence, language)
     if repeated_stem:
         return ValidationResult(
             sentence=sentence,
@@ -286,7 +350,7 @@ def _validate_single(
         )
 
     # 2.5. 서술어 체크 (짧은 문장에서만, 명사구 필터링)
-    if word_count <= 3 and not _check_has_predicate(sentence, request.language):
+    if word_count <= 3 and not _check_has_predicate(sentence, language):
         return ValidationResult(
             sentence=sentence,
             passed=False,
@@ -299,7 +363,7 @@ def _validate_single(
     # 3. 음소 검사
     # core_vocabulary(ASD)는 기능적 의사소통이 목표이므로 음소 검증 스킵
     if request.therapyApproach == TherapyApproach.CORE_VOCABULARY:
-        if request.language == Language.KO and _has_korean_spacing_antipattern(sentence):
+        if language == Language.KO and _has_korean_spacing_antipattern(sentence):
             return ValidationResult(
                 sentence=sentence,
                 passed=False,
@@ -308,8 +372,9 @@ def _validate_single(
                 difficulty=difficulty,
                 fail_reason="core_vocabulary: spacing anti-pattern",
             )
-        core_words = resolve_core_words(request.language.value, request.core_words)
-        if not _contains_core_word(words, core_words, request.language):
+        if core_words is None:
+            core_words = _normalized_core_words(request)
+        if not _contains_core_word(words, core_words, language):
             return ValidationResult(
                 sentence=sentence,
                 passed=False,
@@ -326,19 +391,19 @@ def _validate_single(
             difficulty=difficulty,
         )
 
-    if request.target and request.target.phoneme:
-        if request.language == Language.KO:
-            match_result = find_phoneme_matches(
+    if target and target.phoneme:
+        if language == Language.KO:
+            match_result = find_phoneme_matches_cached(
                 sentence,
-                request.target.phoneme,
-                request.target.position.value,
-                request.target.minOccurrences,
+                target.phoneme,
+                target.position.value,
+                target.minOccurrences,
             )
         else:
-            match_result = find_phoneme_matches_en(
+            match_result = find_phoneme_matches_en_cached(
                 sentence,
-                request.target.phoneme,
-                request.target.minOccurrences,
+                target.phoneme,
+                target.minOccurrences,
             )
 
         if not match_result.meets_minimum:
@@ -348,7 +413,7 @@ def _validate_single(
                 matched_words=match_result.matched_words,
                 word_count=word_count,
                 difficulty=difficulty,
-                fail_reason=f"phoneme: found {match_result.count}, need {request.target.minOccurrences}",
+                fail_reason=f"phoneme: found {match_result.count}, need {target.minOccurrences}",
             )
 
         return ValidationResult(
@@ -369,6 +434,7 @@ def _validate_single(
     )
 
 
+@lru_cache(maxsize=8192)
 def _normalize_token(token: str, language: Language) -> str:
     cleaned = token.strip(string.punctuation)
     if language == Language.EN:
@@ -376,27 +442,39 @@ def _normalize_token(token: str, language: Language) -> str:
     return cleaned
 
 
-def _contains_core_word(words: list[str], core_words: list[str], language: Language) -> bool:
-    if not core_words:
+def _normalized_core_words(request: GenerateRequestV2) -> frozenset[str]:
+    core_words = resolve_core_words(request.language.value, request.core_words)
+    normalized = {_normalize_token(word, request.language) for word in core_words if word}
+    normalized.discard("")
+    return frozenset(normalized)
+
+
+def _contains_core_word(
+    words: list[str], normalized_core: frozenset[str], language: Language
+) -> bool:
+    if not normalized_core:
         return False
 
-    normalized_words = {_normalize_token(word, language) for word in words if word}
-    normalized_core = {_normalize_token(word, language) for word in core_words if word}
-    normalized_words.discard("")
-    normalized_core.discard("")
-    return not normalized_words.isdisjoint(normalized_core)
+    # 빈 토큰은 normalized_core에 없으므로 따로 제거하지 않음
+    return any(_normalize_token(word, language) in normalized_core for word in words)
+
+
+# 어미/보조용언이 띄어 쓰인 core_vocabulary 안티패턴
+# e.g. "이거 뭐 야", "저거 해 줘", "이거 해 봐"
+_KO_SPACING_ANTIPATTERNS = [
+    r"(뭐|왜|어디|누구|이거|저거|그거|여기|거기)\s+(야|니|냐|지|죠)\b",
+    r"(뭐|왜|어디|누구|이거|저거|그거|여기|거기)\s+해(요|니|냐|죠|)?\b",
+    r"([가-힣]+)\s+(줘(?:요)?|줬(?:어|어요)|줄(?:래|게|까)|주(?:라|면|고|지|세요))\b",
+    r"([가-힣]+)\s+봐(?:요|줘|라|)\b",
+    r"([가-힣]+)\s+해(요|줘|라|봐|)?\b",
+]
+_KO_SPACING_ANTIPATTERN_RE = re.compile(
+    "|".join(f"(?:{p})" for p in _KO_SPACING_ANTIPATTERNS)
+)
 
 
 def _has_korean_spacing_antipattern(sentence: str) -> bool:
-    # e.g. "이거 뭐 야", "저거 해 줘", "이거 해 봐"
-    patterns = [
-        r"(뭐|왜|어디|누구|이거|저거|그거|여기|거기)\s+(야|니|냐|지|죠)\b",
-        r"(뭐|왜|어디|누구|이거|저거|그거|여기|거기)\s+해(요|니|냐|죠|)?\b",
-        r"([가-힣]+)\s+(줘(?:요)?|줬(?:어|어요)|줄(?:래|게|까)|주(?:라|면|고|지|세요))\b",
-        r"([가-힣]+)\s+봐(?:요|줘|라|)\b",
-        r"([가-힣]+)\s+해(요|줘|라|봐|)?\b",
-    ]
-    return any(re.search(p, sentence) for p in patterns)
+    return _KO_SPACING_ANTIPATTERN_RE.search(sentence) is not None
 
 
 def get_passed_sentences(results: list[ValidationResult]) -> list[dict]:
@@ -10,6 +10,8 @@ from fastapi import APIRouter, HTTPException
 from .schemas import (
     ErrorCode,
     ErrorResponseV2,
+    GenerateDataV2,
+    GenerateMetaV2,
     GenerateRequestV2,
     GenerateResponseV2,
 )
@@ -46,14 +48,15 @@ async def generate_sentences(request: GenerateRequestV2):
     try:
         result = await run_pipeline(request)
 
-        return {
-            "success": True,
-            "data": {
-                "items": [item.model_dump() for item in result.items],
-                "contrastSets": result.contrast_sets,
-                "meta": result.meta,
-            },
-        }
+        # 응답 모델을 바로 반환해 FastAPI가 한 번에 직렬화하도록 함
+        return GenerateResponseV2(
+            success=True,
+            data=GenerateDataV2(
+                items=result.items,
+                contrastSets=result.contrast_sets,
+                meta=GenerateMetaV2(**result.meta),
+            ),
+        )
     except Exception as e:
         logger.exception("Pipeline failed")
         raise HTTPException(
@@ -7,6 +7,11 @@ class Settings(BaseSettings):
     environment: str = "development"
     debug: bool = True
     allowed_origins: list[str] = ["http://localhost:3000"]
+    # Max in-flight LLM requests per process (shared by all generation calls)
+    llm_max_concurrency: int = 16
+    # Reuse generation results for identical requests (off: every call samples anew)
+    generate_cache_enabled: bool = False
+    generate_cache_size: int = 512
 
     class Config:
         env_file = ".env"
@@ -1,3 +1,7 @@
-from .korean_freq import get_word_frequency, get_sentence_frequency_score
+from .korean_freq import (
+    get_word_frequency,
+    get_sentence_frequency_score,
+    get_sentence_frequency_scores,
+)
 
-__all__ = ["get_word_frequency", "get_sentence_frequency_score"]
+__all__ = ["get_word_frequency", "get_sentence_frequency_score", "get_sentence_frequency_scores"]
@@ -3,27 +3,43 @@
 국립국어원 빈도 데이터를 기반으로 단어와 문장의 친숙도 점수를 계산합니다.
 """
 
+from functools import cache
 import json
 from pathlib import Path
 
-_frequency_data: dict[str, int] | None = None
-
 
+@cache
 def _load_frequency_data() -> dict[str, int]:
-    """빈도 데이터 로드 (싱글톤).
+    """빈도 데이터 로드 (첫 호출 시 한 번만 읽고 캐시).
 
     Returns:
         단어별 빈도 점수 딕셔너리
     """
-    global _frequency_data
-    if _frequency_data is None:
-        data_path = Path(__file__).parent.parent.parent / "data" / "korean_frequency_sample.json"
-        if data_path.exists():
-            with open(data_path, encoding="utf-8") as f:
-                _frequency_data = json.load(f)
-        else:
-            _frequency_data = {}
-    return _frequency_data
+    data_path = Path(__file__).parent.parent.parent / "data" / "korean_frequency_sample.json"
+    if data_path.exists():
+        with open(data_path, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+# 트라이 노드에서 단어 끝(빈도 값)을 표시하는 키. 자식 키는 모두 한 글자이므로 겹치지 않음
+_TRIE_VALUE = ""
+
+
+@cache
+def _load_frequency_trie() -> dict:
+    """빈도 데이터의 접두어 트라이를 만듭니다 (첫 호출 시 한 번만).
+
+    Returns:
+        글자별 중첩 딕셔너리. 단어가 끝나는 노드에는 _TRIE_VALUE 키로 빈도 점수 저장
+    """
+    root: dict = {}
+    for entry, score in _load_frequency_data().items():
+        node = root
+        for char in entry:
+            node = node.setdefault(char, {})
+        node[_TRIE_VALUE] = score
+    return root
 
 
 def get_word_frequency(word: str) -> int:
@@ -41,13 +57,15 @@ def get_word_frequency(word: str) -> int:
         >>> get_word_frequency("알수없는단어")
         50
     """
-    data = _load_frequency_data()
-    # 조사 등 제거하고 어근만 검색 (간단 버전)
-    for length in range(len(word), 0, -1):
-        prefix = word[:length]
-        if prefix in data:
-            return data[prefix]
-    return 50  # 기본값
+    # 조사 등 제거하고 어근만 검색 (간단 버전): 사전에 있는 가장 긴 접두어
+    node = _load_frequency_trie()
+    score = 50  # 기본값
+    for char in word:
+        node = node.get(char)
+        if node is None:
+            break
+        score = node.get(_TRIE_VALUE, score)
+    return score
 
 
 def get_sentence_frequency_score(sentence: str) -> float:
@@ -69,3 +87,32 @@ def get_sentence_frequency_score(sentence: str) -> float:
 
     scores = [get_word_frequency(word) for word in words]
     return sum(scores) / len(scores)
+
+
+def get_sentence_frequency_scores(sentences: list[str]) -> list[float]:
+    """여러 문장의 평균 빈도 점수를 한 번에 계산합니다.
+
+    배치 안에서 반복되는 단어는 한 번만 조회합니다. 결과는 문장마다
+    get_sentence_frequency_score를 호출한 것과 같습니다.
+
+    Args:
+        sentences: 한국어 문장 리스트
+
+    Returns:
+        입력 순서대로 평균 빈도 점수 (0-100) 리스트
+    """
+    word_scores: dict[str, int] = {}
+    results: list[float] = []
+    for sentence in sentences:
+        words = sentence.split()
+        if not words:
+            results.append(50.0)
+            continue
+        total = 0
+        for word in words:
+            score = word_scores.get(word)
+            if score is None:
+                score = word_scores[word] = get_word_frequency(word)
+            total += score
+        results.append(total / len(words))
+    return results
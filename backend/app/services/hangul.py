@@ -0,0 +1,55 @@
+"""한글 자모 분해 유틸리티.
+
+음소 탐지(phoneme)와 음운 규칙(phonology) 모듈이 함께 쓰는 자모 표와
+완성형 음절 분해를 제공합니다. 외부 의존성 없이 유니코드 산술로 분해합니다.
+"""
+
+from functools import lru_cache
+
+# 완성형 음절 분해용 자모 표 (유니코드 순서)
+_CHO = (
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)
+_JUNG = (
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅘ", "ㅙ",
+    "ㅚ", "ㅛ", "ㅜ", "ㅝ", "ㅞ", "ㅟ", "ㅠ", "ㅡ", "ㅢ", "ㅣ",
+)
+_JONG = (
+    "", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+    "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)
+_HANGUL_BASE = 0xAC00
+_HANGUL_COUNT = 11172
+
+# 낱자모(호환용 자모)는 초성 → 중성 → 종성 순으로 자리를 정함
+_JAMO_DECOMPOSITION: dict[str, tuple[str, str, str]] = {
+    **{jong: ("", "", jong) for jong in _JONG if jong},
+    **{jung: ("", jung, "") for jung in _JUNG},
+    **{cho: (cho, "", "") for cho in _CHO},
+}
+
+
+@lru_cache(maxsize=16384)
+def decompose_syllable(char: str) -> tuple[str, str, str] | None:
+    """한글 문자를 초성, 중성, 종성으로 분해합니다.
+
+    Args:
+        char: 분해할 단일 문자 (완성형 음절 또는 호환용 자모)
+
+    Returns:
+        (초성, 중성, 종성) 튜플. 없는 자리는 빈 문자열.
+        한글이 아닌 경우 None 반환.
+
+    Examples:
+        >>> decompose_syllable("강")
+        ('ㄱ', 'ㅏ', 'ㅇ')
+        >>> decompose_syllable("ㄹ")
+        ('ㄹ', '', '')
+    """
+    if len(char) != 1:
+        return None
+    code = ord(char) - _HANGUL_BASE
+    if 0 <= code < _HANGUL_COUNT:
+        return (_CHO[code // 588], _JUNG[(code // 28) % 21], _JONG[code % 28])
+    return _JAMO_DECOMPOSITION.get(char)
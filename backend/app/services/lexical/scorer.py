@@ -4,6 +4,7 @@
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .vocabulary import (
     WORD_FREQUENCY,
@@ -35,6 +36,46 @@ DEFAULT_FREQUENCY = 0.5
 AGE_PENALTY_PER_YEAR = 0.15
 
 
+# 불규칙 활용 처리 (하다 -> 해요, 했어요 등)
+_IRREGULAR_MAPPINGS = {
+    "해요": "하다",
+    "해": "하다",
+    "했어요": "하다",
+    "했어": "하다",
+    "하세요": "하다",
+    "합니다": "하다",
+}
+
+# 일반적인 용언 어미 패턴 (길이 순 정렬 - 긴 것부터)
+_VERB_ENDINGS = (
+    # 4글자 이상 어미
+    "었어요", "았어요", "겠어요", "을게요",
+    # 3글자 어미
+    "습니다", "세요", "어요", "아요", "예요", "이에요",
+    # 2글자 어미
+    "어", "아", "니", "지", "고", "면", "서", "다",
+    "요", "네", "래", "자", "까",
+)
+
+# 어미를 뒤에서부터 한 글자씩 따라가는 역순 트라이. 어미가 끝나는 노드에는
+# _ENDING_LENGTH 키로 어미 길이를 저장 (자식 키는 모두 한 글자이므로 겹치지 않음)
+_ENDING_LENGTH = ""
+
+
+def _build_ending_trie(endings: tuple[str, ...]) -> dict:
+    root: dict = {}
+    for ending in endings:
+        node = root
+        for char in reversed(ending):
+            node = node.setdefault(char, {})
+        node[_ENDING_LENGTH] = len(ending)
+    return root
+
+
+_ENDING_TRIE = _build_ending_trie(_VERB_ENDINGS)
+
+
+@lru_cache(maxsize=4096)
 def _normalize_word(word: str) -> str:
     """단어를 기본형으로 정규화합니다.
 
@@ -46,41 +87,26 @@ def _normalize_word(word: str) -> str:
     Returns:
         정규화된 단어 (어간 또는 원본)
     """
-    # 불규칙 활용 처리 (하다 -> 해요, 했어요 등)
-    irregular_mappings = {
-        "해요": "하다",
-        "해": "하다",
-        "했어요": "하다",
-        "했어": "하다",
-        "하세요": "하다",
-        "합니다": "하다",
-    }
-
-    if word in irregular_mappings:
-        return irregular_mappings[word]
-
-    # 일반적인 용언 어미 패턴 (길이 순 정렬 - 긴 것부터)
-    verb_endings = [
-        # 4글자 이상 어미
-        "었어요", "았어요", "겠어요", "을게요",
-        # 3글자 어미
-        "습니다", "세요", "어요", "아요", "예요", "이에요",
-        # 2글자 어미
-        "어", "아", "니", "지", "고", "면", "서", "다",
-        "요", "네", "래", "자", "까",
-    ]
-
-    for ending in verb_endings:
-        if word.endswith(ending) and len(word) > len(ending):
-            stem = word[:-len(ending)]
-            # 최소 1글자 이상 어간 필요
-            if len(stem) >= 1:
-                # "다"를 붙여서 기본형 반환
-                return stem + "다"
+    if word in _IRREGULAR_MAPPINGS:
+        return _IRREGULAR_MAPPINGS[word]
+
+    # 가장 긴 어미 찾기. 첫 글자는 건너뛰어 최소 1글자 이상 어간 보장
+    node = _ENDING_TRIE
+    ending_length = 0
+    for char in reversed(word[1:]):
+        node = node.get(char)
+        if node is None:
+            break
+        ending_length = node.get(_ENDING_LENGTH, ending_length)
+
+    if ending_length:
+        # "다"를 붙여서 기본형 반환
+        return word[:-ending_length] + "다"
 
     return word
 
 
+@lru_cache(maxsize=8192)
 def get_word_frequency(word: str) -> float:
     """단어의 빈도 점수를 반환합니다.
 
@@ -118,6 +144,7 @@ def get_word_frequency(word: str) -> float:
     return DEFAULT_FREQUENCY
 
 
+@lru_cache(maxsize=8192)
 def get_age_appropriateness(word: str, age: int) -> float:
     """단어의 연령 적절성 점수를 반환합니다.
 
@@ -177,6 +204,17 @@ def get_age_appropriateness(word: str, age: int) -> float:
         return max(0.1, score)  # 최소 0.1
 
 
+# 토큰 정리 시 제외할 조사/어미 패턴
+_PARTICLE_TOKENS = frozenset({
+    "이", "가", "은", "는", "을", "를", "의", "에", "에서", "로", "으로",
+    "와", "과", "하고", "랑", "이랑", "도", "만", "부터", "까지", "보다",
+    "처럼", "같이", "한테", "에게", "께", "더러", "마저", "조차", "밖에",
+})
+
+# 토큰 정리 시 제외할 구두점
+_PUNCTUATION_TOKENS = frozenset({".", ",", "!", "?", "~", "...", "ㅋㅋ", "ㅎㅎ", "^^"})
+
+
 def _extract_tokens(tokens: list[str]) -> list[str]:
     """토큰 리스트를 정리합니다.
 
@@ -188,28 +226,14 @@ def _extract_tokens(tokens: list[str]) -> list[str]:
     Returns:
         정리된 토큰 리스트
     """
-    # 제외할 조사/어미 패턴
-    particles = {
-        "이", "가", "은", "는", "을", "를", "의", "에", "에서", "로", "으로",
-        "와", "과", "하고", "랑", "이랑", "도", "만", "부터", "까지", "보다",
-        "처럼", "같이", "한테", "에게", "께", "더러", "마저", "조차", "밖에",
-    }
-
-    # 구두점
-    punctuation = {".", ",", "!", "?", "~", "...", "ㅋㅋ", "ㅎㅎ", "^^"}
-
-    result = []
-    for token in tokens:
-        token = token.strip()
-        # 빈 토큰, 구두점 제외
-        if not token or token in punctuation:
-            continue
-        # 순수 조사 제외 (1-2글자 조사만)
-        if len(token) <= 2 and token in particles:
-            continue
-        result.append(token)
-
-    return result
+    return [
+        token
+        for token in (raw.strip() for raw in tokens)
+        # 빈 토큰, 구두점, 순수 조사(1-2글자) 제외
+        if token
+        and token not in _PUNCTUATION_TOKENS
+        and not (len(token) <= 2 and token in _PARTICLE_TOKENS)
+    ]
 
 
 def score_sentence_lexical(tokens: list[str], age: int) -> dict:
@@ -2,6 +2,7 @@ from .korean import (
     decompose_hangul,
     has_phoneme_at_position,
     find_phoneme_matches,
+    find_phoneme_matches_cached,
     PhonemeMatchResult,
     PhonemePosition,
 )
@@ -9,6 +10,7 @@ from .english import (
     get_phonemes,
     has_target_phoneme,
     find_phoneme_matches_en,
+    find_phoneme_matches_en_cached,
     PhonemeMatchResultEn,
     PHONEME_MAP,
 )
@@ -18,12 +20,14 @@ __all__ = [
     "decompose_hangul",
     "has_phoneme_at_position",
     "find_phoneme_matches",
+    "find_phoneme_matches_cached",
     "PhonemeMatchResult",
     "PhonemePosition",
     # English
     "get_phonemes",
     "has_target_phoneme",
     "find_phoneme_matches_en",
+    "find_phoneme_matches_en_cached",
     "PhonemeMatchResultEn",
     "PHONEME_MAP",
 ]
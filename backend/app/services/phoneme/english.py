@@ -4,23 +4,38 @@ CMUdict 기반으로 영어 단어의 발음을 분석하고,
 타깃 음소 포함 여부를 확인합니다.
 """
 from dataclasses import dataclass
-import re
+from functools import lru_cache
+import threading
 
 import pronouncing
 import g2p_en
 
 # G2P 모델 (싱글톤)
 _g2p = None
+# 검증 스레드 풀에서 동시에 불려도 모델을 한 번만 만들도록 보호
+_G2P_INIT_LOCK = threading.Lock()
 
 
 def _get_g2p():
     """G2P 모델을 지연 로드합니다."""
     global _g2p
     if _g2p is None:
-        _g2p = g2p_en.G2p()
+        with _G2P_INIT_LOCK:
+            if _g2p is None:
+                _g2p = g2p_en.G2p()
     return _g2p
 
 
+# ARPAbet 강세 표시 숫자(0/1/2) 제거용 변환 테이블
+_STRESS_STRIP = str.maketrans("", "", "012")
+
+# 일괄 G2P 예측 결과 (단어 → 음소 리스트). 크기 초과 시 비움
+_OOV_PREDICTIONS: dict[str, list[str]] = {}
+_OOV_PREDICTIONS_SIZE = 8192
+# 검증 스레드 풀에서 _OOV_PREDICTIONS를 읽고 쓸 때 보호
+_OOV_PREDICTIONS_LOCK = threading.Lock()
+
+
 # ARPAbet 음소 매핑 (UI용 설명)
 PHONEME_MAP = {
     "R": {"ipa": "/r/", "examples": "red, car, run"},
@@ -78,22 +93,72 @@ def get_phonemes(word: str) -> list[str]:
         >>> get_phonemes("cat")
         ['K', 'AE', 'T']
     """
+    return list(_phonemes(word))
+
+
+@lru_cache(maxsize=8192)
+def _phonemes(word: str) -> tuple[str, ...]:
+    """get_phonemes의 메모이즈 버전 (공유되므로 불변 튜플로 반환).
+
+    OOV 단어의 G2P 추론을 같은 단어에 대해 반복하지 않습니다.
+    """
     if not word:
-        return []
+        return ()
 
     clean_word = word.lower().strip()
     if not clean_word:
-        return []
+        return ()
 
     # CMUdict에서 조회
-    phones = pronouncing.phones_for_word(clean_word)
-    if phones:
-        return [re.sub(r"[012]", "", p) for p in phones[0].split()]
+    phones = _cmu_phonemes(clean_word)
+    if phones is not None:
+        return phones
+
+    # OOV: g2p로 예측 (일괄 예측 결과가 있으면 재사용)
+    with _OOV_PREDICTIONS_LOCK:
+        predicted = _OOV_PREDICTIONS.get(clean_word)
+    if predicted is None:
+        predicted = _get_g2p()(clean_word)
+    return tuple(p.translate(_STRESS_STRIP) for p in predicted if p.isalpha() and len(p) <= 3)
 
-    # OOV: g2p로 예측
-    g2p = _get_g2p()
-    predicted = g2p(clean_word)
-    return [re.sub(r"[012]", "", p) for p in predicted if p.isalpha() and len(p) <= 3]
+
+@lru_cache(maxsize=8192)
+def _cmu_phonemes(word: str) -> tuple[str, ...] | None:
+    """CMUdict 발음(강세 제거)을 반환합니다. 사전에 없는 단어(OOV)면 None."""
+    phones = pronouncing.phones_for_word(word)
+    if not phones:
+        return None
+    return tuple(p.translate(_STRESS_STRIP) for p in phones[0].split())
+
+
+def _predict_oov_batch(words: list[str]) -> None:
+    """CMUdict에 없는 단어들을 G2P 한 번 호출로 예측해 둡니다.
+
+    g2p 호출마다 토큰화/품사 태깅 준비 비용이 들기 때문에, 한 문장의 OOV 단어를
+    공백으로 이어 한 번에 넘기고 결과를 단어 경계(" ")에서 다시 나눕니다.
+    단어 수가 맞지 않으면 아무것도 저장하지 않고 단어별 예측에 맡깁니다.
+
+    Args:
+        words: 소문자 알파벳으로 정리된 OOV 단어들 (CMUdict 조회는 호출자가 수행)
+    """
+    with _OOV_PREDICTIONS_LOCK:
+        pending = [w for w in dict.fromkeys(words) if w not in _OOV_PREDICTIONS]
+    if len(pending) < 2:
+        return
+
+    predictions: list[list[str]] = [[]]
+    for phoneme in _get_g2p()(" ".join(pending)):
+        if phoneme == " ":
+            predictions.append([])
+        else:
+            predictions[-1].append(phoneme)
+    if len(predictions) != len(pending):
+        return
+
+    with _OOV_PREDICTIONS_LOCK:
+        if len(_OOV_PREDICTIONS) + len(pending) > _OOV_PREDICTIONS_SIZE:
+            _OOV_PREDICTIONS.clear()
+        _OOV_PREDICTIONS.update(zip(pending, predictions))
 
 
 def has_target_phoneme(word: str, target: str) -> bool:
@@ -112,8 +177,7 @@ def has_target_phoneme(word: str, target: str) -> bool:
         >>> has_target_phoneme("cat", "R")
         False
     """
-    phonemes = get_phonemes(word)
-    return target.upper() in phonemes
+    return target.upper() in _phonemes(word)
 
 
 def find_phoneme_matches_en(
@@ -138,16 +202,37 @@ def find_phoneme_matches_en(
         >>> result.meets_minimum
         True
     """
-    words = sentence.split()
-    matched_words = []
+    cleaned = ["".join(c for c in word if c.isalpha()) for word in sentence.split()]
+    cleaned = [clean for clean in cleaned if clean]
+    _predict_oov_batch([
+        word for word in (clean.lower() for clean in cleaned) if _cmu_phonemes(word) is None
+    ])
 
-    for word in words:
-        clean = "".join(c for c in word if c.isalpha())
-        if clean and has_target_phoneme(clean, target):
-            matched_words.append(clean.lower())
+    matched_words = [clean.lower() for clean in cleaned if has_target_phoneme(clean, target)]
 
     return PhonemeMatchResultEn(
         matched_words=matched_words,
         count=len(matched_words),
         meets_minimum=len(matched_words) >= min_occurrences,
     )
+
+
+@lru_cache(maxsize=8192)
+def find_phoneme_matches_en_cached(
+    sentence: str,
+    target: str,
+    min_occurrences: int = 1,
+) -> PhonemeMatchResultEn:
+    """find_phoneme_matches_en의 메모이즈 버전.
+
+    반환 객체는 호출자 간에 공유되므로 수정하지 않아야 합니다.
+
+    Args:
+        sentence: 영어 문장
+        target: ARPAbet 음소
+        min_occurrences: 최소 출현 횟수
+
+    Returns:
+        PhonemeMatchResultEn 객체 (캐시됨)
+    """
+    return find_phoneme_matches_en(sentence, target, min_occurrences)
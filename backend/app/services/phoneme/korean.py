@@ -1,10 +1,14 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
-import hgtk
+from app.services.hangul import decompose_syllable
 
 PhonemePosition = Literal["onset", "nucleus", "coda", "any"]
 
+# decompose_hangul이 분해할 수 있는 문자 범위: 호환용 자모와 완성형 음절
+_HANGUL_LETTER_RANGES = (range(0x3131, 0x3190), range(0xAC00, 0xD7A4))
+
 
 @dataclass
 class PhonemeMatchResult:
@@ -36,11 +40,7 @@ def decompose_hangul(char: str) -> tuple[str, str, str] | None:
         >>> decompose_hangul("강")
         ("ㄱ", "ㅏ", "ㅇ")
     """
-    try:
-        cho, jung, jong = hgtk.letter.decompose(char)
-        return (cho, jung, jong if jong else "")
-    except Exception:
-        return None
+    return decompose_syllable(char)
 
 
 def has_phoneme_at_position(
@@ -66,32 +66,46 @@ def has_phoneme_at_position(
         초성 'ㅇ'은 무음이므로 타깃에서 제외됩니다.
         종성 'ㅇ'([ŋ])만 유효한 타깃입니다.
     """
-    for char in word:
-        decomposed = decompose_hangul(char)
-        if decomposed is None:
-            continue
-        cho, jung, jong = decomposed
-
-        # 초성 'ㅇ'은 무음이므로 타깃에서 제외
-        if phoneme == "ㅇ":
-            if position == "onset":
-                return False
-            if position == "coda" and jong == "ㅇ":
-                return True
-            if position == "any" and jong == "ㅇ":
-                return True
-            continue
-
-        if position == "onset" and cho == phoneme:
-            return True
-        if position == "nucleus" and jung == phoneme:
-            return True
-        if position == "coda" and jong == phoneme:
-            return True
-        if position == "any" and phoneme in (cho, jung, jong):
-            return True
-
-    return False
+    return not _matching_letters(phoneme, position).isdisjoint(word)
+
+
+@lru_cache(maxsize=256)
+def _matching_letters(phoneme: str, position: PhonemePosition) -> frozenset[str]:
+    """해당 위치에 타깃 음소를 가진 한글 문자 집합을 만듭니다.
+
+    음소/위치 조합마다 한 번만 전체 한글 문자를 분해해 두고, 이후 단어 검사는
+    문자 집합 포함 여부만 확인합니다.
+
+    Args:
+        phoneme: 타깃 음소
+        position: 검사할 위치
+
+    Returns:
+        조건을 만족하는 문자들의 frozenset
+    """
+    letters = []
+    for letter_range in _HANGUL_LETTER_RANGES:
+        for code in letter_range:
+            char = chr(code)
+            decomposed = decompose_hangul(char)
+            if decomposed is None:
+                continue
+            cho, jung, jong = decomposed
+
+            # 초성 'ㅇ'은 무음이므로 타깃에서 제외, 종성 'ㅇ'만 유효
+            if phoneme == "ㅇ":
+                if position in ("coda", "any") and jong == "ㅇ":
+                    letters.append(char)
+                continue
+
+            if (
+                (position == "onset" and cho == phoneme)
+                or (position == "nucleus" and jung == phoneme)
+                or (position == "coda" and jong == phoneme)
+                or (position == "any" and phoneme in (cho, jung, jong))
+            ):
+                letters.append(char)
+    return frozenset(letters)
 
 
 def find_phoneme_matches(
@@ -118,13 +132,43 @@ def find_phoneme_matches(
         >>> find_phoneme_matches("라면 먹고 싶어요", "ㄹ", "onset")
         PhonemeMatchResult(matched_words=["라면"], count=1, meets_minimum=True)
     """
-    words = sentence.split()
-    matched_words = []
-    for word in words:
-        if has_phoneme_at_position(word, phoneme, position):
-            matched_words.append(word)
+    letters = _matching_letters(phoneme, position)
+    # 문장 전체에 타깃 문자가 하나도 없으면 단어 분리 없이 바로 반환
+    if letters.isdisjoint(sentence):
+        return PhonemeMatchResult(
+            matched_words=[],
+            count=0,
+            meets_minimum=min_occurrences <= 0,
+        )
+
+    matched_words = [word for word in sentence.split() if not letters.isdisjoint(word)]
     return PhonemeMatchResult(
         matched_words=matched_words,
         count=len(matched_words),
         meets_minimum=len(matched_words) >= min_occurrences,
     )
+
+
+@lru_cache(maxsize=8192)
+def find_phoneme_matches_cached(
+    sentence: str,
+    phoneme: str,
+    position: PhonemePosition,
+    min_occurrences: int = 1,
+) -> PhonemeMatchResult:
+    """find_phoneme_matches의 메모이즈 버전.
+
+    검증, 대조 세트 검사 등에서 같은 문장을 같은 조건으로 반복 검사할 때
+    음절 분해를 다시 하지 않습니다. 반환 객체는 호출자 간에 공유되므로
+    수정하지 않아야 합니다.
+
+    Args:
+        sentence: 검사할 문장
+        phoneme: 타깃 음소
+        position: 검사할 위치
+        min_occurrences: 최소 출현 횟수
+
+    Returns:
+        PhonemeMatchResult 객체 (캐시됨)
+    """
+    return find_phoneme_matches(sentence, phoneme, position, min_occurrences)
@@ -7,9 +7,10 @@ This module provides functions to detect various Korean phonological rules:
 - Liquidization (유음화): /n/ becomes /l/ or /l/ becomes /n/
 """
 
+from functools import lru_cache
 from typing import Literal
 
-import hgtk
+from app.services.hangul import decompose_syllable
 
 # Consonant categories for phonological rules
 PLAIN_OBSTRUENTS = {"ㄱ", "ㄷ", "ㅂ"}  # 평폐쇄음
@@ -48,11 +49,7 @@ def decompose_char(char: str) -> tuple[str, str, str] | None:
         Tuple of (onset, nucleus, coda) or None if not a Korean syllable.
         Coda is empty string if there's no final consonant.
     """
-    try:
-        cho, jung, jong = hgtk.letter.decompose(char)
-        return (cho, jung, jong if jong else "")
-    except Exception:
-        return None
+    return decompose_syllable(char)
 
 
 def is_hangul_syllable(char: str) -> bool:
@@ -69,12 +66,79 @@ def get_syllables(text: str) -> list[tuple[int, str, tuple[str, str, str]]]:
     Returns:
         List of (index, character, (onset, nucleus, coda)) tuples.
     """
+    return list(_syllables(text))
+
+
+@lru_cache(maxsize=1024)
+def _syllables(text: str) -> tuple[tuple[int, str, tuple[str, str, str]], ...]:
+    """Cached, immutable form of get_syllables shared by the rule detectors."""
     result = []
     for i, char in enumerate(text):
         decomposed = decompose_char(char)
         if decomposed is not None:
             result.append((i, char, decomposed))
-    return result
+    return tuple(result)
+
+
+# Indices into the per-rule result tuple returned by _scan_rules
+_NASALIZATION, _FORTITION, _LIAISON, _LIQUIDIZATION = range(4)
+
+# Codas that trigger fortition of a following plain consonant
+_FORTITION_CODAS = {"ㄱ", "ㄷ", "ㅂ", "ㅅ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ"}
+
+
+@lru_cache(maxsize=1024)
+def _pair_rules(coda: str, onset2: str) -> tuple[tuple[int, bool, str], ...]:
+    """Rule environments created by a coda followed by the next onset.
+
+    Returns:
+        Tuple of (rule index, reported at second syllable, description suffix).
+        The description is prefixed with the two syllables by the caller.
+    """
+    rules = []
+
+    # Nasalization: plain obstruent coda before a nasal onset
+    if coda in PLAIN_OBSTRUENTS and onset2 in {"ㄴ", "ㅁ"}:
+        nasalized = NASALIZATION_MAP.get(coda, coda)
+        rules.append((_NASALIZATION, False, f"{coda} -> {nasalized} (before {onset2})"))
+
+    # Fortition: obstruent coda before a plain consonant onset
+    # Simple coda check (ignoring complex codas for now)
+    if coda in _FORTITION_CODAS and onset2 in PLAIN_CONSONANTS:
+        fortified = FORTITION_MAP.get(onset2, onset2)
+        rules.append((_FORTITION, True, f"{onset2} -> {fortified} (after coda {coda})"))
+
+    # Liaison: any coda before the null onset (ㅇ)
+    if coda and onset2 == "ㅇ":
+        rules.append((_LIAISON, False, f"coda {coda} -> onset of next syllable"))
+
+    # Liquidization: ㄴ + ㄹ (신라 -> 실라) or ㄹ + ㄴ (설날 -> 설랄)
+    if coda == "ㄴ" and onset2 == "ㄹ":
+        rules.append((_LIQUIDIZATION, False, "ㄴ -> ㄹ (before ㄹ)"))
+    elif coda == "ㄹ" and onset2 == "ㄴ":
+        rules.append((_LIQUIDIZATION, True, "ㄴ -> ㄹ (after ㄹ)"))
+
+    return tuple(rules)
+
+
+@lru_cache(maxsize=1024)
+def _scan_rules(text: str) -> tuple[tuple[tuple[int, str], ...], ...]:
+    """Detect all four rule environments in one pass over adjacent syllables.
+
+    Returns:
+        Per-rule tuples of (position, description), indexed by _NASALIZATION,
+        _FORTITION, _LIAISON and _LIQUIDIZATION.
+    """
+    syllables = _syllables(text)
+    results: tuple[list[tuple[int, str]], ...] = ([], [], [], [])
+
+    for (pos1, char1, (_, _, coda)), (pos2, char2, (onset2, _, _)) in zip(
+        syllables, syllables[1:]
+    ):
+        for rule, at_second, detail in _pair_rules(coda, onset2):
+            results[rule].append((pos2 if at_second else pos1, f"{char1}{char2}: {detail}"))
+
+    return tuple(tuple(found) for found in results)
 
 
 def detect_nasalization(text: str) -> list[tuple[int, str]]:
@@ -91,20 +155,7 @@ def detect_nasalization(text: str) -> list[tuple[int, str]]:
     Returns:
         List of (position, description) tuples where nasalization occurs.
     """
-    syllables = get_syllables(text)
-    results = []
-
-    for i in range(len(syllables) - 1):
-        pos1, char1, (_, _, coda) = syllables[i]
-        pos2, char2, (onset2, _, _) = syllables[i + 1]
-
-        # Check if coda is a plain obstruent and next onset is a nasal
-        if coda in PLAIN_OBSTRUENTS and onset2 in {"ㄴ", "ㅁ"}:
-            nasalized = NASALIZATION_MAP.get(coda, coda)
-            description = f"{char1}{char2}: {coda} -> {nasalized} (before {onset2})"
-            results.append((pos1, description))
-
-    return results
+    return list(_scan_rules(text)[_NASALIZATION])
 
 
 def detect_fortition(text: str) -> list[tuple[int, str]]:
@@ -121,21 +172,7 @@ def detect_fortition(text: str) -> list[tuple[int, str]]:
     Returns:
         List of (position, description) tuples where fortition occurs.
     """
-    syllables = get_syllables(text)
-    results = []
-
-    for i in range(len(syllables) - 1):
-        pos1, char1, (_, _, coda) = syllables[i]
-        pos2, char2, (onset2, _, _) = syllables[i + 1]
-
-        # Check if coda triggers fortition and next onset is a plain consonant
-        # Simple coda check (ignoring complex codas for now)
-        if coda in {"ㄱ", "ㄷ", "ㅂ", "ㅅ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ"} and onset2 in PLAIN_CONSONANTS:
-            fortified = FORTITION_MAP.get(onset2, onset2)
-            description = f"{char1}{char2}: {onset2} -> {fortified} (after coda {coda})"
-            results.append((pos2, description))
-
-    return results
+    return list(_scan_rules(text)[_FORTITION])
 
 
 def detect_liaison(text: str) -> list[tuple[int, str]]:
@@ -152,19 +189,7 @@ def detect_liaison(text: str) -> list[tuple[int, str]]:
     Returns:
         List of (position, description) tuples where liaison occurs.
     """
-    syllables = get_syllables(text)
-    results = []
-
-    for i in range(len(syllables) - 1):
-        pos1, char1, (_, _, coda) = syllables[i]
-        pos2, char2, (onset2, _, _) = syllables[i + 1]
-
-        # Check if coda exists and next onset is null (ㅇ)
-        if coda and coda != "" and onset2 == "ㅇ":
-            description = f"{char1}{char2}: coda {coda} -> onset of next syllable"
-            results.append((pos1, description))
-
-    return results
+    return list(_scan_rules(text)[_LIAISON])
 
 
 def detect_liquidization(text: str) -> list[tuple[int, str]]:
@@ -182,24 +207,7 @@ def detect_liquidization(text: str) -> list[tuple[int, str]]:
     Returns:
         List of (position, description) tuples where liquidization occurs.
     """
-    syllables = get_syllables(text)
-    results = []
-
-    for i in range(len(syllables) - 1):
-        pos1, char1, (_, _, coda) = syllables[i]
-        pos2, char2, (onset2, _, _) = syllables[i + 1]
-
-        # Case 1: coda ㄴ + onset ㄹ -> ㄹㄹ (신라 -> 실라)
-        if coda == "ㄴ" and onset2 == "ㄹ":
-            description = f"{char1}{char2}: ㄴ -> ㄹ (before ㄹ)"
-            results.append((pos1, description))
-
-        # Case 2: coda ㄹ + onset ㄴ -> ㄹㄹ (난로 -> 날로, but typically 설날 -> 설랄)
-        elif coda == "ㄹ" and onset2 == "ㄴ":
-            description = f"{char1}{char2}: ㄴ -> ㄹ (after ㄹ)"
-            results.append((pos2, description))
-
-    return results
+    return list(_scan_rules(text)[_LIQUIDIZATION])
 
 
 RuleMode = Literal["avoid", "require"]
@@ -231,24 +239,12 @@ def check_phonological_rules(text: str, mode: RuleMode = "avoid") -> tuple[bool,
         >>> check_phonological_rules("사과", "avoid")
         (True, [])
     """
-    messages = []
-
-    # Detect all rule environments
-    nasalizations = detect_nasalization(text)
-    for pos, desc in nasalizations:
-        messages.append(f"Nasalization: {desc}")
-
-    fortitions = detect_fortition(text)
-    for pos, desc in fortitions:
-        messages.append(f"Fortition: {desc}")
-
-    liaisons = detect_liaison(text)
-    for pos, desc in liaisons:
-        messages.append(f"Liaison: {desc}")
-
-    liquidizations = detect_liquidization(text)
-    for pos, desc in liquidizations:
-        messages.append(f"Liquidization: {desc}")
+    # Detect all rule environments in a single pass
+    nasalizations, fortitions, liaisons, liquidizations = _scan_rules(text)
+    messages = [f"Nasalization: {desc}" for _, desc in nasalizations]
+    messages.extend(f"Fortition: {desc}" for _, desc in fortitions)
+    messages.extend(f"Liaison: {desc}" for _, desc in liaisons)
+    messages.extend(f"Liquidization: {desc}" for _, desc in liquidizations)
 
     has_rules = len(messages) > 0
 
@@ -70,3 +70,28 @@ class TestDiversifyResults:
         results = diversify_results(scored, count=3)
         endings = [r.sentence.split()[-1] for r in results]
         assert len(set(endings)) >= 2
+
+    def test_quota_only_respects_limits(self):
+        """한도 기반 단일 패스 선택도 개수와 유사 문장 제한을 지킴"""
+        scored = [
+            ScoredSentence(
+                sentence=sentence,
+                matched_words=[word],
+                word_count=3,
+                difficulty=None,
+                score=score,
+                breakdown={},
+            )
+            for sentence, word, score in [
+                ("라면이 너무 맛있어요", "라면이", 85.0),
+                ("라면을 먹고 싶어요", "라면을", 82.0),
+                ("달리기를 하고 싶어요", "달리기를", 78.0),
+                ("물을 마시고 싶어요", "물을", 72.0),
+            ]
+        ]
+
+        results = diversify_results(scored, count=3, max_similar=1, quota_only=True)
+
+        assert len(results) == 3
+        assert results[0].score == 85.0
+        assert sum(1 for r in results if "라면" in r.sentence) == 1
@@ -6,8 +6,15 @@ This module tests:
 - Communicative function integration in prompts
 """
 
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
 import pytest
 
+from app.agents.tools.generate import generate_candidates
+from app.config import settings
 from app.services.prompt.builder import build_generation_prompt
 from app.api.v2.schemas import (
     GenerateRequestV2,
@@ -198,3 +205,146 @@ class TestBuildGenerationPrompt:
             kw in prompt.lower() for kw in safety_keywords_en
         )
         assert has_safety, "Prompt should include child safety warning"
+
+
+def _complexity_request(count: int = 2) -> GenerateRequestV2:
+    """Korean /ㄹ/ complexity request used by the generation tests."""
+    return GenerateRequestV2(
+        language=Language.KO,
+        age=5,
+        count=count,
+        target=TargetConfig(phoneme="ㄹ", position=PhonemePosition.ONSET, minOccurrences=1),
+        sentenceLength=2,
+        diagnosis=DiagnosisType.SSD,
+        therapyApproach=TherapyApproach.COMPLEXITY,
+    )
+
+
+def _fake_client(payload: dict, delay: float = 0.0) -> MagicMock:
+    """Mock LLM client returning ``payload`` as JSON; records peak concurrent calls."""
+    client = MagicMock()
+    client.active = 0
+    client.peak = 0
+
+    async def create(**kwargs):
+        client.active += 1
+        client.peak = max(client.peak, client.active)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            client.active -= 1
+        message = SimpleNamespace(content=orjson.dumps(payload).decode())
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    client.chat.completions.create = AsyncMock(side_effect=create)
+    return client
+
+
+class TestResponseCache:
+    """Test cases for the generation response cache."""
+
+    async def test_concurrent_misses_share_one_call(self, monkeypatch):
+        """같은 요청의 동시 캐시 미스는 LLM 호출 하나를 공유."""
+        monkeypatch.setattr(settings, "generate_cache_enabled", True)
+        client = _fake_client({"items": [{"sentence": "라면 먹어요"}]}, delay=0.01)
+        request = _complexity_request()
+
+        with patch("app.agents.tools.generate._get_client", return_value=client), patch.dict(
+            "app.agents.tools.generate._RESPONSE_CACHE", clear=True
+        ):
+            results = await asyncio.gather(
+                *(generate_candidates(request, batch_size=3) for _ in range(3))
+            )
+            cached = await generate_candidates(request, batch_size=3)
+
+        assert client.chat.completions.create.await_count == 1
+        assert all(r.candidates == [{"sentence": "라면 먹어요"}] for r in [*results, cached])
+        # 호출자마다 독립된 복사본을 받음
+        assert results[0] is not results[1]
+
+    async def test_use_cache_false_always_calls_llm(self, monkeypatch):
+        """재시도(use_cache=False)는 캐시가 있어도 새로 생성."""
+        monkeypatch.setattr(settings, "generate_cache_enabled", True)
+        client = _fake_client({"items": [{"sentence": "라면 먹어요"}]})
+        request = _complexity_request()
+
+        with patch("app.agents.tools.generate._get_client", return_value=client), patch.dict(
+            "app.agents.tools.generate._RESPONSE_CACHE", clear=True
+        ):
+            await generate_candidates(request, batch_size=3)
+            await generate_candidates(request, batch_size=3, use_cache=False)
+
+        assert client.chat.completions.create.await_count == 2
+
+
+class TestLlmConcurrency:
+    """Test cases for the LLM concurrency limit."""
+
+    async def test_sharded_calls_respect_max_concurrency(self, monkeypatch):
+        """분할 호출은 llm_max_concurrency를 넘어 동시에 실행되지 않음."""
+        monkeypatch.setattr(settings, "llm_max_concurrency", 2)
+        client = _fake_client({"items": [{"sentence": "라면 먹어요"}]}, delay=0.01)
+
+        with patch("app.agents.tools.generate._get_client", return_value=client):
+            # 15개씩 5개 호출로 분할
+            await generate_candidates(_complexity_request(), batch_size=75, use_cache=False)
+
+        assert client.chat.completions.create.await_count == 5
+        assert client.peak == 2
+
+
+class TestGenerateParsing:
+    """Test cases for parsing LLM responses in generate_candidates."""
+
+    async def test_sets_format_keeps_both_sentences_per_set(self):
+        """sets 형식은 세트마다 target/contrast 두 문장을 모두 유지."""
+        payload = {
+            "sets": [
+                {
+                    "target_word": "라면",
+                    "contrast_word": "나면",
+                    "target_sentence": {"tokens": ["라면", "먹어요"]},
+                    "contrast_sentence": {"tokens": ["나면", "좋아요"]},
+                },
+                {
+                    "target_word": "로봇",
+                    "contrast_word": "노봇",
+                    "target_sentence": {"tokens": ["로봇", "있어요"]},
+                    "contrast_sentence": {"tokens": ["노봇", "없어요"]},
+                },
+            ]
+        }
+        client = _fake_client(payload)
+
+        with patch("app.agents.tools.generate._get_client", return_value=client):
+            result = await generate_candidates(_complexity_request(), batch_size=2)
+
+        assert [c["sentence"] for c in result.candidates] == [
+            "라면 먹어요",
+            "나면 좋아요",
+            "로봇 있어요",
+            "노봇 없어요",
+        ]
+        assert len(result.contrast_sets) == 2
+
+    async def test_duplicates_dropped_without_truncation(self):
+        """중복 문장/세트는 제거하되 batch_size를 넘는 고유 문장은 유지."""
+        repeated_set = {
+            "target_word": "라면",
+            "contrast_word": "나면",
+            "target_sentence": {"tokens": ["라면", "먹어요"]},
+            "contrast_sentence": {"tokens": ["나면", "좋아요"]},
+        }
+        other_set = {
+            "target_word": "로봇",
+            "contrast_word": "노봇",
+            "target_sentence": {"tokens": ["로봇", "있어요"]},
+            "contrast_sentence": {"tokens": ["노봇", "없어요"]},
+        }
+        client = _fake_client({"sets": [repeated_set, repeated_set, other_set]})
+
+        with patch("app.agents.tools.generate._get_client", return_value=client):
+            result = await generate_candidates(_complexity_request(), batch_size=1)
+
+        assert len(result.candidates) == 4
+        assert [s["targetWord"] for s in result.contrast_sets] == ["라면", "로봇"]
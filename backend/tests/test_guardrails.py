@@ -4,6 +4,7 @@
 """
 
 import pytest
+from app.agents.guardrails import child_safety
 from app.agents.guardrails.child_safety import filter_unsafe_sentences
 
 
@@ -36,3 +37,14 @@ class TestChildSafetyFilter:
         """빈 입력 처리"""
         filtered = filter_unsafe_sentences([])
         assert filtered == []
+
+    def test_mixed_case_forbidden_word(self, monkeypatch):
+        """대소문자가 섞인 금칙어도 대소문자 구분 없이 필터링"""
+        monkeypatch.setattr(child_safety, "_load_forbidden_words", lambda: frozenset({"Beer"}))
+        child_safety._get_forbidden_pattern.cache_clear()
+        try:
+            filtered = filter_unsafe_sentences(["I like beer", "BEER time", "I like milk"])
+        finally:
+            child_safety._get_forbidden_pattern.cache_clear()
+
+        assert filtered == ["I like milk"]
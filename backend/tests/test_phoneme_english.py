@@ -64,6 +64,38 @@ class TestFindPhonemeMatchesEn:
         result = find_phoneme_matches_en("The red car runs", "R", min_occurrences=2)
         assert result.meets_minimum is True
 
+    def test_batched_oov_matches_per_word(self, monkeypatch):
+        """여러 OOV 단어를 G2P 한 번에 예측해도 단어별 예측과 같은 결과여야 합니다."""
+        # 가상의 OOV 단어별 음소 (g2p_en처럼 단어 사이를 " "로 구분해 반환)
+        fake_phonemes = {
+            "zorblax": ["Z", "AO1", "R", "B", "L", "AE0", "K", "S"],
+            "glimfo": ["G", "L", "IH1", "M", "F", "OW0"],
+            "snarvel": ["S", "N", "AA1", "R", "V", "AH0", "L"],
+        }
+        calls = []
+
+        def fake_g2p(text):
+            calls.append(text)
+            result = []
+            for word in text.split():
+                result.extend(fake_phonemes[word] + [" "])
+            return result[:-1]
+
+        monkeypatch.setattr("app.services.phoneme.english._get_g2p", lambda: fake_g2p)
+
+        sentence = "Zorblax glimfo snarvel red"
+        for target in ["Z", "G", "R", "L", "V"]:
+            per_word = [
+                word
+                for word in fake_phonemes
+                if target in fake_phonemes[word]
+            ] + (["red"] if target == "R" else [])
+            result = find_phoneme_matches_en(sentence, target)
+            assert result.matched_words == per_word
+
+        # CMUdict에 있는 "red"는 제외하고 OOV 단어만 한 번에 예측
+        assert calls == ["zorblax glimfo snarvel"]
+
 
 class TestPhonemeMap:
     def test_common_phonemes_exist(self):
@@ -180,3 +180,34 @@ class TestRunPipeline:
         assert result.items == []
         assert result.meta["generatedCount"] == 0
         assert result.meta["averageScore"] == 0
+
+    @pytest.mark.asyncio
+    @patch("app.agents.pipeline.generate_candidates")
+    async def test_pipeline_retries_only_shortfall(self, mock_generate):
+        """재시도는 부족할 때만, 부족분 크기로 요청."""
+        request = GenerateRequestV2(
+            language=Language.KO,
+            age=5,
+            count=1,
+            target=TargetConfig(phoneme="ㄹ", position=PhonemePosition.ONSET, minOccurrences=1),
+            sentenceLength=3,
+            diagnosis=DiagnosisType.SSD,
+            therapyApproach=TherapyApproach.COMPLEXITY,
+        )
+        mock_generate.side_effect = [
+            GenerateCandidatesResult(candidates=[{"sentence": "라면이 너무 맛있어요"}]),
+            GenerateCandidatesResult(
+                candidates=[
+                    {"sentence": "달리기가 정말 재미있어요"},
+                    {"sentence": "라볶이를 먹고 싶어요"},
+                ]
+            ),
+            GenerateCandidatesResult(candidates=[{"sentence": "로봇이 춤을 춰요"}]),
+        ]
+
+        result = await run_pipeline(request, max_attempts=3)
+
+        # 3개 목표: 첫 배치 1개 통과 -> 부족분 2개 * 1.5로 한 번만 재요청
+        batch_sizes = [call.args[1] for call in mock_generate.call_args_list]
+        assert batch_sizes == [4, 3]
+        assert len(result.items) == 3
@@ -102,6 +102,17 @@ class TestScoreSentences:
         # 요청 패턴이 기능 점수가 더 높아야 함
         assert request_score.breakdown["function"] >= general_score.breakdown["function"]
 
+    def test_duplicate_sentences_scored_once(self, asd_request):
+        """중복 문장은 한 번만 점수화하고 자기 자신과의 다양성 페널티를 받지 않음"""
+        validated = [
+            {"sentence": "라면 주세요", "matched_words": ["라면"], "word_count": 2},
+            {"sentence": "라면 주세요", "matched_words": ["라면"], "word_count": 2},
+        ]
+        results = score_sentences(validated, asd_request)
+
+        assert len(results) == 1
+        assert results[0].breakdown["diversity_penalty"] == 0
+
     def test_sorted_by_score(self, korean_request):
         """점수순 정렬"""
         validated = [